@@ -1,3 +1,36 @@
 from django.contrib import admin
 
+from .models import AirQualityReading, HealthRecommendation, MonitoringStation, SavedLocation, UserProfile
+
 # Register your models here.
+
+@admin.register(AirQualityReading)
+class AirQualityReadingAdmin(admin.ModelAdmin):
+    list_display = ('location', 'aqi_value', 'pm25', 'pm10', 'timestamp', 'data_source', 'quality_flags')
+    list_filter = ('location', 'data_source')
+    date_hierarchy = 'timestamp'
+
+
+@admin.register(MonitoringStation)
+class MonitoringStationAdmin(admin.ModelAdmin):
+    list_display = ('name', 'latitude', 'longitude', 'is_active')
+    list_filter = ('is_active',)
+    search_fields = ('name',)
+
+
+@admin.register(UserProfile)
+class UserProfileAdmin(admin.ModelAdmin):
+    list_display = ('user', 'location')
+    search_fields = ('user__username', 'user__email', 'location')
+
+
+@admin.register(SavedLocation)
+class SavedLocationAdmin(admin.ModelAdmin):
+    list_display = ('user', 'location', 'created_at')
+    search_fields = ('user__username', 'location')
+
+
+@admin.register(HealthRecommendation)
+class HealthRecommendationAdmin(admin.ModelAdmin):
+    list_display = ('aqi_min', 'aqi_max', 'severity_level', 'activity_type', 'recommendation')
+    list_filter = ('severity_level', 'activity_type')
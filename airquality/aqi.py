@@ -0,0 +1,34 @@
+"""
+AQI categories and pollutant breakpoints shared by the map and ranking views.
+"""
+from bisect import bisect_left
+
+# (upper bound of AQI value, name, RGB colour), US EPA scale
+AQI_CATEGORIES = [
+    (50, 'Good', (0, 228, 0)),
+    (100, 'Moderate', (255, 255, 0)),
+    (150, 'Unhealthy for Sensitive Groups', (255, 126, 0)),
+    (200, 'Unhealthy', (255, 0, 0)),
+    (300, 'Very Unhealthy', (143, 63, 151)),
+    (float('inf'), 'Hazardous', (126, 0, 35)),
+]
+
+CATEGORY_NAMES = [name for _, name, _ in AQI_CATEGORIES]
+CATEGORY_COLORS = [color for _, _, color in AQI_CATEGORIES]
+
+# Upper bounds of each category for raw concentrations (µg/m³)
+BREAKPOINTS = {
+    'aqi_value': [50, 100, 150, 200, 300],
+    'pm25': [12.0, 35.4, 55.4, 150.4, 250.4],
+    'pm10': [54, 154, 254, 354, 424],
+}
+
+
+def category_index(value, field='aqi_value'):
+    """Index into AQI_CATEGORIES for a value of ``field``"""
+    return bisect_left(BREAKPOINTS[field], value)
+
+
+def aqi_category(value):
+    """Category name for an AQI value, e.g. 'Moderate'"""
+    return CATEGORY_NAMES[category_index(value)]
@@ -0,0 +1,129 @@
+"""
+Cold storage for old AirQualityReading rows.
+
+Readings older than a threshold are moved out of the database into one
+Parquet file per location per month:
+
+    <AIRQUALITY_ARCHIVE_ROOT>/<location-slug>/<YYYY-MM>.parquet
+
+Columnar files keep pollutant columns contiguous and compressed, so trend
+aggregates only read the columns they need (see airquality.trends).
+"""
+import hashlib
+import os
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from .lazy import lazy_import
+from .models import AirQualityReading
+
+pd = lazy_import('pandas')
+
+# Columns stored in the archive, in file order
+ARCHIVE_COLUMNS = [
+    'id', 'location', 'timestamp', 'aqi_value',
+    'pm25', 'pm10', 'no2', 'so2', 'co', 'o3',
+    'temperature', 'humidity', 'wind_speed', 'visibility',
+    'data_source', 'quality_flags',
+]
+
+DEFAULT_ARCHIVE_AFTER_DAYS = 365
+
+# Rows fetched from the DB per batch while archiving
+BATCH_SIZE = 50_000
+
+
+def archive_root():
+    """Directory holding the Parquet archive"""
+    return Path(getattr(settings, 'AIRQUALITY_ARCHIVE_ROOT', settings.BASE_DIR / 'archive'))
+
+
+def archive_cutoff(now=None):
+    """Readings strictly older than this timestamp belong in the archive"""
+    days = getattr(settings, 'AIRQUALITY_ARCHIVE_AFTER_DAYS', DEFAULT_ARCHIVE_AFTER_DAYS)
+    return (now or timezone.now()) - timedelta(days=days)
+
+
+def location_dir(location):
+    """
+    Archive directory name for a location.
+
+    ASCII slugs keep existing partitions where they are; names that slugify
+    to nothing in ASCII (e.g. 北京) keep their Unicode letters, and names
+    with no letters at all fall back to a short hash, so a location never
+    lands in the archive root. Directories may be shared, so readers still
+    filter rows on the location column.
+    """
+    return (slugify(location) or slugify(location, allow_unicode=True)
+            or hashlib.sha1(location.encode()).hexdigest()[:12])
+
+
+def partition_path(location, month, root=None):
+    """Path of the Parquet file for one location and month ('YYYY-MM')"""
+    return (root or archive_root()) / location_dir(location) / f'{month}.parquet'
+
+
+def _write_partition(path, frame):
+    """Merge ``frame`` into an existing partition and atomically replace it"""
+    if path.exists():
+        existing = pd.read_parquet(path)
+        frame = pd.concat([existing, frame], ignore_index=True)
+        frame = frame.drop_duplicates(subset='id', keep='last')
+
+    frame = frame.sort_values('timestamp').reset_index(drop=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.parquet.tmp')
+    frame.to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+    os.replace(tmp_path, path)
+
+
+def archive_readings(cutoff=None, root=None, dry_run=False, batch_size=BATCH_SIZE):
+    """
+    Move readings older than ``cutoff`` into the Parquet archive.
+
+    Rows are deleted from the database only after the partition they belong
+    to has been written, so an interrupted run never loses data; a re-run
+    simply merges the same ids again.
+
+    Returns a dict with the number of rows archived and the files written.
+    """
+    cutoff = cutoff or archive_cutoff()
+    root = root or archive_root()
+    stats = {'rows': 0, 'files': set()}
+
+    queryset = (AirQualityReading.objects
+                .filter(timestamp__lt=cutoff)
+                .order_by('id')
+                .values(*ARCHIVE_COLUMNS))
+
+    last_id = 0
+    while True:
+        rows = list(queryset.filter(id__gt=last_id)[:batch_size])
+        if not rows:
+            break
+        first_id, last_id = rows[0]['id'], rows[-1]['id']
+
+        frame = pd.DataFrame.from_records(rows, columns=ARCHIVE_COLUMNS)
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'], utc=True)
+        months = frame['timestamp'].dt.strftime('%Y-%m')
+
+        for (location, month), part in frame.groupby([frame['location'], months], sort=False):
+            path = partition_path(location, month, root)
+            stats['files'].add(path)
+            if not dry_run:
+                _write_partition(path, part)
+
+        stats['rows'] += len(frame)
+        if not dry_run:
+            with transaction.atomic():
+                AirQualityReading.objects.filter(
+                    timestamp__lt=cutoff, id__gte=first_id, id__lte=last_id,
+                ).delete()
+
+    stats['files'] = sorted(stats['files'])
+    return stats
@@ -0,0 +1,165 @@
+"""
+Per-user dashboard snapshots.
+
+A snapshot bundles everything the dashboard shows for one user: current AQI
+at their locations, matching health recommendations and active alerts. It
+is built once and stored in the cache, so a dashboard load is two cache
+reads. Snapshots are invalidated when one of the user's locations receives
+new readings (see airquality.ingest) or when the profile changes.
+
+Snapshots are keyed by a per-user generation number and invalidation bumps
+the generation instead of deleting the snapshot. A snapshot built while an
+invalidation lands is stored under the old generation, which is never read
+again, so it can't hide the newer data.
+"""
+import time
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from .aqi import aqi_category
+from .models import AirQualityReading, HealthRecommendation, SavedLocation, UserProfile
+
+SNAPSHOT_KEY = 'airquality:dashboard:{user_id}:{generation}'
+GENERATION_KEY = 'airquality:dashboard:{user_id}:generation'
+# Safety net only; snapshots are normally replaced by invalidation
+SNAPSHOT_TIMEOUT = 60 * 60 * 24
+
+# Alert when AQI reaches this level; people with health conditions get an earlier warning
+ALERT_AQI = 151
+SENSITIVE_ALERT_AQI = 101
+
+
+def generation_key(user_id):
+    return GENERATION_KEY.format(user_id=user_id)
+
+
+def snapshot_key(user_id, generation):
+    return SNAPSHOT_KEY.format(user_id=user_id, generation=generation)
+
+
+def _generation(user_id):
+    """Current snapshot generation of a user, started at a fresh value if unknown"""
+    key = generation_key(user_id)
+    generation = cache.get(key)
+    if generation is None:
+        # Never restart at a number an evicted generation may have used
+        generation = time.time_ns()
+        if not cache.add(key, generation, None):
+            generation = cache.get(key, generation)
+    return generation
+
+
+def get_profile(user):
+    """The user's profile; unsaved (and empty) if they never set one up"""
+    try:
+        return user.profile
+    except UserProfile.DoesNotExist:
+        return UserProfile(user=user)
+
+
+def _latest_readings(locations):
+    """Most recent reading per location (index scan on location, timestamp)"""
+    latest = {}
+    for location in locations:
+        reading = (AirQualityReading.objects
+                   .filter(location=location)
+                   .order_by('-timestamp')
+                   .values('aqi_value', 'pm25', 'pm10', 'timestamp')
+                   .first())
+        if reading is not None:
+            latest[location] = reading
+    return latest
+
+
+def _matching_recommendations(aqi, conditions):
+    matches = []
+    for rec in HealthRecommendation.objects.filter(aqi_min__lte=aqi, aqi_max__gte=aqi):
+        targets = set(rec.target_conditions or [])
+        if targets and not targets & conditions:
+            continue
+        matches.append({
+            'recommendation': rec.recommendation,
+            'severity_level': rec.severity_level,
+            'icon_class': rec.icon_class,
+            'activity_type': rec.activity_type,
+            'targeted': bool(targets),
+        })
+    return matches
+
+
+def build_snapshot(user):
+    """Compute a user's dashboard snapshot from the database"""
+    profile = get_profile(user)
+    locations = profile.locations
+    conditions = set(profile.health_conditions or [])
+    latest = _latest_readings(locations)
+
+    current = []
+    for location in locations:
+        reading = latest.get(location)
+        if reading is None:
+            current.append({'location': location, 'aqi': None, 'category': None})
+            continue
+        current.append({
+            'location': location,
+            'aqi': reading['aqi_value'],
+            'category': aqi_category(reading['aqi_value']),
+            'pm25': reading['pm25'],
+            'pm10': reading['pm10'],
+            'timestamp': reading['timestamp'].isoformat(),
+        })
+
+    threshold = SENSITIVE_ALERT_AQI if conditions else ALERT_AQI
+    alerts = [
+        {
+            'location': item['location'],
+            'aqi': item['aqi'],
+            'category': item['category'],
+            'message': f"Air quality in {item['location']} is {item['category']} (AQI {item['aqi']})",
+        }
+        for item in current
+        if item['aqi'] is not None and item['aqi'] >= threshold
+    ]
+
+    # Advice follows the worst of the user's locations
+    worst = max((item['aqi'] for item in current if item['aqi'] is not None), default=None)
+    recommendations = _matching_recommendations(worst, conditions) if worst is not None else []
+
+    return {
+        'generated_at': timezone.now().isoformat(),
+        'location': profile.location,
+        'health_conditions': sorted(conditions),
+        'locations': current,
+        'recommendations': recommendations,
+        'alerts': alerts,
+    }
+
+
+def get_snapshot(user):
+    """Cached snapshot for ``user``, built on first access after invalidation"""
+    key = snapshot_key(user.id, _generation(user.id))
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = build_snapshot(user)
+        cache.set(key, snapshot, SNAPSHOT_TIMEOUT)
+    return snapshot
+
+
+def invalidate_user(user_id):
+    try:
+        cache.incr(generation_key(user_id))
+    except ValueError:
+        # No generation means no snapshot that could still be read
+        pass
+
+
+def invalidate_locations(locations):
+    """Drop snapshots of every user following any of ``locations``"""
+    locations = list(locations)
+    if not locations:
+        return
+    user_ids = set(UserProfile.objects.filter(location__in=locations).values_list('user_id', flat=True))
+    user_ids.update(SavedLocation.objects.filter(location__in=locations).values_list('user_id', flat=True))
+    for user_id in user_ids:
+        invalidate_user(user_id)
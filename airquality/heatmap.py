@@ -0,0 +1,323 @@
+"""
+Interpolated pollution surfaces served as XYZ map tiles.
+
+Latest station values are spread over a tile's pixel grid with inverse
+distance weighting (IDW), vectorised with NumPy and a SciPy k-d tree so each
+pixel only looks at its nearest stations. Rendered tiles are cached in an
+in-process LRU and on disk, keyed by tile and data version. The version
+covers everything a tile is drawn from: the time bucket (so readings age out
+of MAX_AGE_HOURS), the newest recent reading at a station, a generation
+bumped by ingest (upserts replace a reading's values but keep its id), and
+the station list with its last edit. Readings for locations without a
+station don't change it.
+"""
+import io
+import json
+import math
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from .aqi import BREAKPOINTS, CATEGORY_COLORS
+from .lazy import lazy_import
+from .models import AirQualityReading, MonitoringStation
+
+np = lazy_import('numpy')
+Image = lazy_import('PIL.Image')
+spatial = lazy_import('scipy.spatial')
+
+FIELDS = list(BREAKPOINTS)
+
+TILE_SIZE = 256
+JSON_GRID_SIZE = 32
+MAX_ZOOM = 16
+
+DEFAULTS = {
+    'POWER': 2.0,             # IDW distance exponent
+    'NEIGHBOURS': 8,          # stations considered per pixel
+    'RADIUS_KM': 50.0,        # pixels further than this from any station stay empty
+    'MAX_AGE_HOURS': 3,       # ignore stations without a recent reading
+    'BUCKET_MINUTES': 15,     # tiles are re-rendered at least this often
+    'LRU_SIZE': 512,          # tiles kept in memory per process
+    'ALPHA': 160,             # PNG overlay opacity
+}
+
+KM_PER_DEG_LAT = 110.574
+KM_PER_DEG_LON = 111.320
+
+GENERATION_KEY = 'airquality:heatmap:generation'
+
+
+def heatmap_setting(name):
+    return getattr(settings, 'AIRQUALITY_HEATMAP', {}).get(name, DEFAULTS[name])
+
+
+def cache_dir():
+    return Path(getattr(settings, 'AIRQUALITY_TILE_CACHE_DIR', settings.BASE_DIR / 'tilecache'))
+
+
+def time_bucket(now=None):
+    """Start of the current BUCKET_MINUTES bucket, as epoch seconds"""
+    size = heatmap_setting('BUCKET_MINUTES') * 60
+    now = (now or timezone.now()).timestamp()
+    return int(now // size * size)
+
+
+def reading_cutoff(bucket):
+    """Oldest reading drawn for a bucket; fixed per bucket so tiles match their version"""
+    start = datetime.fromtimestamp(bucket, tz=dt_timezone.utc)
+    return start - timedelta(hours=heatmap_setting('MAX_AGE_HOURS'))
+
+
+def _generation():
+    """Shared ingest generation, started at a fresh value if unknown"""
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        # Never restart at a number an evicted generation may have used
+        generation = time.time_ns()
+        if not cache.add(GENERATION_KEY, generation, None):
+            generation = cache.get(GENERATION_KEY, generation)
+    return generation
+
+
+def invalidate_locations(locations):
+    """Start a new data version if readings were stored at an active station"""
+    locations = list(locations)
+    if not locations or not MonitoringStation.objects.filter(is_active=True, name__in=locations).exists():
+        return
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        # Evicted; the next version starts from a fresh generation anyway
+        pass
+
+
+def data_version(now=None):
+    """Identifies the inputs of every tile; part of every cache key and the ETag"""
+    bucket = time_bucket(now)
+    stations = MonitoringStation.objects.filter(is_active=True).aggregate(
+        count=Count('id'), edited=Max('updated_at'),
+    )
+    edited = int(stations['edited'].timestamp() * 1e6) if stations['edited'] else 0
+    readings = (AirQualityReading.objects
+                .filter(location__in=MonitoringStation.objects.filter(is_active=True).values('name'),
+                        timestamp__gte=reading_cutoff(bucket))
+                .aggregate(latest=Max('id')))
+    return f"{bucket}-{readings['latest'] or 0}.{_generation()}-{stations['count']}.{edited}"
+
+
+def tile_bounds(z, x, y):
+    """(west, south, east, north) of an XYZ tile in degrees"""
+    n = 2 ** z
+    west = x / n * 360.0 - 180.0
+    east = (x + 1) / n * 360.0 - 180.0
+    north = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / n))))
+    south = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (y + 1) / n))))
+    return west, south, east, north
+
+
+def pixel_centers(z, x, y, size):
+    """Longitude/latitude grids of pixel centres for a tile (Web Mercator rows)"""
+    n = 2 ** z
+    offsets = (np.arange(size) + 0.5) / size
+    lons = (x + offsets) / n * 360.0 - 180.0
+    lats = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * (y + offsets) / n))))
+    return np.meshgrid(lons, lats)
+
+
+class StationField:
+    """Latest value per station for one pollutant, indexed for neighbour lookups"""
+
+    def __init__(self, lons, lats, values):
+        self.values = np.asarray(values, dtype='float64')
+        self.lat0 = float(np.mean(lats)) if len(lats) else 0.0
+        self.tree = spatial.cKDTree(self._project(np.asarray(lons), np.asarray(lats))) if len(lons) else None
+
+    def _project(self, lons, lats):
+        """Equirectangular projection to km, accurate enough at city scale"""
+        scale = KM_PER_DEG_LON * math.cos(math.radians(self.lat0))
+        return np.column_stack([np.ravel(lons) * scale, np.ravel(lats) * KM_PER_DEG_LAT])
+
+    def interpolate(self, lons, lats):
+        """IDW estimate for every point; NaN where no station is within range"""
+        if self.tree is None:
+            return np.full(np.shape(lons), np.nan)
+
+        k = min(heatmap_setting('NEIGHBOURS'), len(self.values))
+        distances, indexes = self.tree.query(
+            self._project(lons, lats), k=k,
+            distance_upper_bound=heatmap_setting('RADIUS_KM'),
+        )
+        distances = distances.reshape(-1, k)
+        indexes = indexes.reshape(-1, k)
+
+        in_range = np.isfinite(distances)
+        # Missing neighbours come back as index == len(values); point them anywhere
+        neighbour_values = self.values[np.where(in_range, indexes, 0)]
+        with np.errstate(divide='ignore'):
+            weights = np.where(in_range, 1.0 / np.maximum(distances, 1e-6) ** heatmap_setting('POWER'), 0.0)
+
+        total = weights.sum(axis=1)
+        with np.errstate(invalid='ignore'):
+            estimate = (weights * neighbour_values).sum(axis=1) / total
+        estimate[total == 0] = np.nan
+        return estimate.reshape(np.shape(lons))
+
+
+def load_station_field(field, cutoff=None):
+    """Build a StationField from the latest reading since ``cutoff`` at each active station"""
+    stations = {s.name: s for s in MonitoringStation.objects.filter(is_active=True)}
+    cutoff = cutoff or reading_cutoff(time_bucket())
+    recent = (AirQualityReading.objects
+              .filter(location__in=list(stations), timestamp__gte=cutoff)
+              .exclude(**{f'{field}__isnull': True})
+              .order_by('location', '-timestamp')
+              .values_list('location', field))
+
+    latest = {}
+    for location, value in recent:
+        latest.setdefault(location, value)
+
+    names = list(latest)
+    return StationField(
+        [stations[name].longitude for name in names],
+        [stations[name].latitude for name in names],
+        [latest[name] for name in names],
+    )
+
+
+def colorize(grid, field):
+    """RGBA image array: AQI category colours, transparent where there is no data"""
+    palette = np.array(CATEGORY_COLORS, dtype='uint8')
+    valid = np.isfinite(grid)
+    categories = np.searchsorted(BREAKPOINTS[field], np.where(valid, grid, 0), side='left')
+    rgba = np.zeros(grid.shape + (4,), dtype='uint8')
+    rgba[..., :3] = palette[categories]
+    rgba[..., 3] = np.where(valid, heatmap_setting('ALPHA'), 0)
+    return rgba
+
+
+def render_png(station_field, z, x, y, field):
+    lons, lats = pixel_centers(z, x, y, TILE_SIZE)
+    grid = station_field.interpolate(lons, lats)
+    buffer = io.BytesIO()
+    Image.fromarray(colorize(grid, field)).save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def render_json(station_field, z, x, y, field):
+    lons, lats = pixel_centers(z, x, y, JSON_GRID_SIZE)
+    grid = station_field.interpolate(lons, lats)
+    values = [None if math.isnan(v) else round(v, 1) for v in grid.ravel().tolist()]
+    return json.dumps({
+        'z': z, 'x': x, 'y': y,
+        'field': field,
+        'bounds': tile_bounds(z, x, y),
+        'size': JSON_GRID_SIZE,
+        'values': values,
+    }, separators=(',', ':')).encode('utf-8')
+
+
+RENDERERS = {
+    'png': render_png,
+    'json': render_json,
+}
+
+
+class TileCache:
+    """
+    Two-level tile cache: in-memory LRU in front of files under cache_dir().
+
+    The lock only guards the LRU; tiles are read and rendered outside it so a
+    slow render doesn't hold up cache hits for other tiles.
+    """
+
+    def __init__(self):
+        self._lru = OrderedDict()
+        self._fields = {}
+        self._version = None
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        version, field, z, x, y, fmt = key
+        return cache_dir() / version / field / str(z) / str(x) / f'{y}.{fmt}'
+
+    def _switch_version(self, version):
+        """Drop everything held for an older data version; True if it changed"""
+        with self._lock:
+            if version == self._version:
+                return False
+            self._lru.clear()
+            self._fields.clear()
+            self._version = version
+            return True
+
+    def _remove_old_versions(self, version):
+        root = cache_dir()
+        if root.exists():
+            for old in root.iterdir():
+                if old.name != version:
+                    shutil.rmtree(old, ignore_errors=True)
+
+    def _station_field(self, field, version):
+        with self._lock:
+            station_field = self._fields.get((version, field))
+        if station_field is None:
+            # The version starts with its time bucket
+            station_field = load_station_field(field, reading_cutoff(int(version.split('-')[0])))
+            with self._lock:
+                self._fields[version, field] = station_field
+        return station_field
+
+    def _render(self, key):
+        version, field, z, x, y, fmt = key
+        path = self._path(key)
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            pass
+
+        tile = RENDERERS[fmt](self._station_field(field, version), z, x, y, field)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f'{path.name}.{threading.get_ident()}.tmp')
+            tmp_path.write_bytes(tile)
+            tmp_path.replace(path)
+        except OSError:
+            # Another process may be removing this version's directory
+            pass
+        return tile
+
+    def get(self, field, z, x, y, fmt, version=None):
+        """(version, tile bytes); pass ``version`` if the caller already has it"""
+        version = version or data_version()
+        key = (version, field, z, x, y, fmt)
+
+        if self._switch_version(version):
+            self._remove_old_versions(version)
+
+        with self._lock:
+            tile = self._lru.get(key)
+            if tile is not None:
+                self._lru.move_to_end(key)
+                return version, tile
+
+        tile = self._render(key)
+
+        with self._lock:
+            if self._version == version:
+                self._lru[key] = tile
+                if len(self._lru) > heatmap_setting('LRU_SIZE'):
+                    self._lru.popitem(last=False)
+        return version, tile
+
+
+tile_cache = TileCache()
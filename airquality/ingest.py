@@ -0,0 +1,181 @@
+"""
+Ingest of raw sensor readings: parse, run through the quality pipeline,
+then persist with bulk inserts, one reading per sensor slot.
+"""
+import math
+from collections import defaultdict
+
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from . import heatmap
+from .dashboard import invalidate_locations
+from .leaderboard import record_readings
+from .models import AirQualityReading
+from .quality import pipeline, quality_setting
+
+REQUIRED_FIELDS = ['location', 'aqi_value', 'pm25', 'pm10']
+OPTIONAL_FIELDS = ['no2', 'so2', 'co', 'o3', 'temperature', 'humidity', 'wind_speed', 'visibility']
+
+# A sensor slot holds one reading (see the constraint on AirQualityReading)
+SLOT_FIELDS = ['location', 'data_source', 'timestamp']
+# Overwritten when a real reading lands on an occupied slot
+UPSERT_FIELDS = ['aqi_value', 'pm25', 'pm10'] + OPTIONAL_FIELDS + ['quality_flags']
+
+
+def build_reading(record):
+    """Turn one incoming dict into an unsaved AirQualityReading; raises ValueError"""
+    if not isinstance(record, dict):
+        raise ValueError('reading must be an object')
+    missing = [field for field in REQUIRED_FIELDS if record.get(field) in (None, '')]
+    if missing:
+        raise ValueError(f'missing field(s): {", ".join(missing)}')
+
+    timestamp = record.get('timestamp')
+    if timestamp:
+        timestamp = parse_datetime(str(timestamp))
+        if timestamp is None:
+            raise ValueError('invalid timestamp')
+        if timezone.is_naive(timestamp):
+            timestamp = timezone.make_aware(timestamp)
+    else:
+        timestamp = timezone.now()
+
+    try:
+        values = {
+            'pm25': float(record['pm25']),
+            'pm10': float(record['pm10']),
+        }
+        for field in OPTIONAL_FIELDS:
+            if record.get(field) is not None:
+                values[field] = float(record[field])
+        # json.loads accepts Infinity/NaN; int() of those raises OverflowError/ValueError
+        values['aqi_value'] = int(float(record['aqi_value']))
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError('pollutant values must be numeric')
+    if not all(math.isfinite(value) for value in values.values()):
+        raise ValueError('pollutant values must be finite')
+
+    location = _text(record, 'location')
+    if not location:
+        raise ValueError('missing field(s): location')
+
+    return AirQualityReading(
+        location=location,
+        data_source=_text(record, 'data_source'),
+        timestamp=timestamp,
+        **values
+    )
+
+
+def _text(record, field):
+    """A stripped string field, checked against the column length"""
+    value = record.get(field)
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        raise ValueError(f'{field} must be a string')
+    value = value.strip()
+    max_length = AirQualityReading._meta.get_field(field).max_length
+    if len(value) > max_length:
+        raise ValueError(f'{field} must be at most {max_length} characters')
+    return value
+
+
+def _seed_new_sensors(readings):
+    """Load recent history once for sensors this process has not seen yet"""
+    window = quality_setting('WINDOW')
+    for key in {pipeline.sensor_key(reading) for reading in readings}:
+        if pipeline.has_sensor(key):
+            continue
+        location, data_source = key
+        history = (AirQualityReading.objects
+                   .filter(location=location, data_source=data_source)
+                   .order_by('-timestamp')[:window])
+        pipeline.seed(key, reversed(list(history)))
+
+
+def _slot(reading):
+    return (reading.location, reading.data_source, reading.timestamp)
+
+
+def _store(readings):
+    """
+    Persist readings, at most one per sensor slot; returns the ones written.
+
+    Real readings replace whatever occupies their slot (a resent reading or
+    an earlier gap filler). Gap fillers never replace anything: another
+    worker may already have stored a real reading or filler for that slot.
+    """
+    real, fillers = {}, {}
+    for reading in readings:
+        target = fillers if reading.quality_flags & AirQualityReading.QUALITY_INTERPOLATED else real
+        target[_slot(reading)] = reading
+    for slot in real:
+        fillers.pop(slot, None)
+
+    by_sensor = defaultdict(list)
+    for location, data_source, timestamp in fillers:
+        by_sensor[location, data_source].append(timestamp)
+    for (location, data_source), timestamps in by_sensor.items():
+        stored = (AirQualityReading.objects
+                  .filter(location=location, data_source=data_source, timestamp__in=timestamps)
+                  .values_list('timestamp', flat=True))
+        for timestamp in stored:
+            fillers.pop((location, data_source, timestamp), None)
+
+    if real:
+        AirQualityReading.objects.bulk_create(
+            real.values(),
+            update_conflicts=True,
+            unique_fields=SLOT_FIELDS,
+            update_fields=UPSERT_FIELDS,
+        )
+    if fillers:
+        # Races with other workers between the check above and the insert
+        AirQualityReading.objects.bulk_create(fillers.values(), ignore_conflicts=True)
+
+    return sorted([*real.values(), *fillers.values()], key=lambda reading: reading.timestamp)
+
+
+def ingest_readings(records):
+    """
+    Validate and store a batch of raw readings.
+
+    Returns a summary dict with counts and per-row errors (by index).
+    """
+    readings, errors = [], []
+    for index, record in enumerate(records):
+        try:
+            readings.append(build_reading(record))
+        except ValueError as e:
+            errors.append({'index': index, 'error': str(e)})
+
+    readings.sort(key=lambda reading: reading.timestamp)
+    _seed_new_sensors(readings)
+
+    accepted = []
+    rejected = 0
+    for reading in readings:
+        kept = pipeline.process(reading)
+        if not kept:
+            rejected += 1
+        accepted.extend(kept)
+
+    accepted = _store(accepted)
+    locations = {reading.location for reading in accepted}
+    invalidate_locations(locations)
+    heatmap.invalidate_locations(locations)
+    record_readings(accepted)
+
+    flagged = sum(1 for r in accepted if r.quality_flags & (
+        AirQualityReading.QUALITY_SPIKE | AirQualityReading.QUALITY_STUCK))
+    interpolated = sum(1 for r in accepted if r.quality_flags & AirQualityReading.QUALITY_INTERPOLATED)
+    return {
+        'received': len(records),
+        'stored': len(accepted),
+        'rejected': rejected,
+        'flagged': flagged,
+        'interpolated': interpolated,
+        'errors': errors,
+    }
@@ -0,0 +1,54 @@
+"""
+Deferred imports for heavy optional dependencies.
+
+pandas, NumPy, SciPy, Pillow and friends add hundreds of milliseconds to
+worker boot but are only needed by a few endpoints. ``lazy_import`` returns
+a stand-in module whose real import runs on first attribute access, so
+``pd = lazy_import('pandas')`` at the top of a module costs nothing until
+``pd.DataFrame`` is used.
+"""
+import importlib
+import importlib.util
+import types
+
+# Modules deferred this way; airquality.warmup can import them ahead of time
+HEAVY_MODULES = [
+    'numpy',
+    'pandas',
+    'pyarrow.parquet',
+    'scipy.spatial',
+    'PIL.Image',
+    'msgpack',
+]
+
+
+class LazyModule(types.ModuleType):
+    """Placeholder that imports the named module when an attribute is first read"""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name, optional=False):
+    """
+    Module ``name``, imported on first use.
+
+    With ``optional=True`` a missing package gives ``None`` instead of an
+    ImportError later, for dependencies the code can run without. Only the
+    top-level package is looked up, which doesn't execute any of its code.
+    """
+    if optional and importlib.util.find_spec(name.partition('.')[0]) is None:
+        return None
+    return LazyModule(name)
@@ -0,0 +1,217 @@
+"""
+City AQI leaderboard kept current on ingest.
+
+Each location's latest AQI is held in a sorted structure so ranking queries
+("top N worst/best", "cities in a category") cost O(log n + k) instead of an
+ORDER BY over the latest reading per city. Two backends:
+
+- Redis sorted set, used when REDIS_URL is set, shared by all workers
+- an in-process sorted list, warmed from the database on first use and
+  refreshed periodically so other workers' ingests show up
+
+Only cities that reported within MAX_AGE_HOURS are ranked; a city that went
+quiet drops out instead of holding its last AQI forever.
+"""
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.text import slugify
+
+from .aqi import AQI_CATEGORIES, aqi_category
+from .models import AirQualityReading
+
+REDIS_KEY = 'airquality:leaderboard'
+
+# Seconds before the in-memory board reloads from the database
+REFRESH_SECONDS = 60
+
+# Cities without a reading this recent are left out of the rankings
+MAX_AGE_HOURS = 6
+
+
+def stale_before():
+    """Readings older than this no longer count as a city's current AQI"""
+    hours = getattr(settings, 'AIRQUALITY_LEADERBOARD_MAX_AGE_HOURS', MAX_AGE_HOURS)
+    return timezone.now() - timedelta(hours=hours)
+
+
+def category_bounds(category):
+    """(exclusive lower, inclusive upper) AQI bounds for a category name or slug"""
+    lower = float('-inf')
+    for upper, name, _ in AQI_CATEGORIES:
+        if category.lower() in (name.lower(), slugify(name)):
+            return lower, upper
+        lower = upper
+    raise ValueError(f'Unknown AQI category: {category}')
+
+
+def latest_from_database(since):
+    """(location, aqi, timestamp) of the newest reading per location since ``since``"""
+    newest = dict(AirQualityReading.objects
+                  .filter(timestamp__gte=since)
+                  .values('location')
+                  .annotate(latest=Max('timestamp'))
+                  .values_list('location', 'latest'))
+    if not newest:
+        return []
+    readings = (AirQualityReading.objects
+                .filter(timestamp__in=set(newest.values()), location__in=list(newest))
+                .values_list('location', 'aqi_value', 'timestamp'))
+    return [(location, aqi, ts) for location, aqi, ts in readings if newest[location] == ts]
+
+
+def _entry(location, aqi):
+    return {'location': location, 'aqi': int(aqi), 'category': aqi_category(aqi)}
+
+
+class MemoryLeaderboard:
+    """Sorted (aqi, location) list plus a location index; stale entries are skipped"""
+
+    def __init__(self):
+        self._entries = []
+        self._scores = {}
+        self._updated = {}
+        self._loaded_at = None
+        self._lock = threading.RLock()
+
+    def _ensure_loaded(self):
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < REFRESH_SECONDS:
+            return
+        with self._lock:
+            self._entries, self._scores, self._updated = [], {}, {}
+            for location, aqi, timestamp in latest_from_database(stale_before()):
+                self._set(location, aqi, timestamp)
+            self._loaded_at = time.monotonic()
+
+    def _set(self, location, aqi, timestamp):
+        previous = self._scores.get(location)
+        if previous is not None:
+            index = bisect_left(self._entries, (previous, location))
+            del self._entries[index]
+        insort(self._entries, (aqi, location))
+        self._scores[location] = aqi
+        self._updated[location] = timestamp
+
+    def update(self, location, aqi, timestamp):
+        """Record a new reading; older readings than the stored one are ignored"""
+        with self._lock:
+            last = self._updated.get(location)
+            if last is not None and timestamp < last:
+                return
+            self._set(location, aqi, timestamp)
+
+    def _fresh(self, indexes, limit):
+        """Up to ``limit`` entries at ``indexes`` (in order) that are not stale"""
+        cutoff = stale_before()
+        entries = []
+        for index in indexes:
+            if len(entries) == limit:
+                break
+            aqi, location = self._entries[index]
+            if self._updated[location] >= cutoff:
+                entries.append(_entry(location, aqi))
+        return entries
+
+    def top(self, limit, worst=True):
+        self._ensure_loaded()
+        with self._lock:
+            count = len(self._entries)
+            indexes = range(count - 1, -1, -1) if worst else range(count)
+            return self._fresh(indexes, limit)
+
+    def in_range(self, lower, upper, limit):
+        """Locations with lower < aqi <= upper, worst first"""
+        self._ensure_loaded()
+        with self._lock:
+            start = bisect_right(self._entries, (lower, '\uffff'))
+            end = bisect_right(self._entries, (upper, '\uffff'))
+            return self._fresh(range(end - 1, start - 1, -1), limit)
+
+
+class RedisLeaderboard:
+    """Sorted set of location -> AQI, plus a sorted set of location -> last update time"""
+
+    def __init__(self, url):
+        import redis
+        self.client = redis.Redis.from_url(url)
+        self._warmed = False
+
+    @property
+    def _seen_key(self):
+        return f'{REDIS_KEY}:seen'
+
+    def _ensure_loaded(self):
+        if not self._warmed:
+            if not self.client.exists(REDIS_KEY):
+                for location, aqi, timestamp in latest_from_database(stale_before()):
+                    self.update(location, aqi, timestamp)
+            self._warmed = True
+        self._drop_stale()
+
+    def _drop_stale(self):
+        """Remove cities whose last update is older than the cutoff"""
+        stale = self.client.zrangebyscore(self._seen_key, '-inf', f'({stale_before().timestamp()}')
+        if stale:
+            pipe = self.client.pipeline()
+            pipe.zrem(REDIS_KEY, *stale)
+            pipe.zrem(self._seen_key, *stale)
+            pipe.execute()
+
+    def update(self, location, aqi, timestamp):
+        stamp = timestamp.timestamp()
+        last = self.client.zscore(self._seen_key, location)
+        if last is not None and stamp < last:
+            return
+        pipe = self.client.pipeline()
+        pipe.zadd(REDIS_KEY, {location: aqi})
+        pipe.zadd(self._seen_key, {location: stamp})
+        pipe.execute()
+
+    def _decode(self, rows):
+        return [_entry(location.decode(), score) for location, score in rows]
+
+    def top(self, limit, worst=True):
+        self._ensure_loaded()
+        if worst:
+            return self._decode(self.client.zrevrange(REDIS_KEY, 0, limit - 1, withscores=True))
+        return self._decode(self.client.zrange(REDIS_KEY, 0, limit - 1, withscores=True))
+
+    def in_range(self, lower, upper, limit):
+        self._ensure_loaded()
+        rows = self.client.zrevrangebyscore(REDIS_KEY, upper, f'({lower}', start=0, num=limit, withscores=True)
+        return self._decode(rows)
+
+
+_board = None
+_board_lock = threading.Lock()
+
+
+def get_leaderboard():
+    global _board
+    if _board is None:
+        with _board_lock:
+            if _board is None:
+                redis_url = getattr(settings, 'AIRQUALITY_LEADERBOARD_REDIS_URL', '')
+                _board = RedisLeaderboard(redis_url) if redis_url else MemoryLeaderboard()
+    return _board
+
+
+def record_readings(readings):
+    """Push the newest reading per location from an ingested batch"""
+    cutoff = stale_before()
+    newest = {}
+    for reading in readings:
+        if reading.quality_flags & AirQualityReading.QUALITY_INTERPOLATED or reading.timestamp < cutoff:
+            continue
+        current = newest.get(reading.location)
+        if current is None or reading.timestamp > current.timestamp:
+            newest[reading.location] = reading
+
+    board = get_leaderboard()
+    for reading in newest.values():
+        board.update(reading.location, reading.aqi_value, reading.timestamp)
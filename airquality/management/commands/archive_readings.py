@@ -0,0 +1,36 @@
+"""
+Move old AirQualityReading rows from the database into the Parquet archive.
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from airquality.archive import archive_cutoff, archive_readings
+
+
+class Command(BaseCommand):
+    help = 'Archive readings older than a threshold into per-location, per-month Parquet files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int,
+                            help='Archive readings older than this many days '
+                                 '(default: AIRQUALITY_ARCHIVE_AFTER_DAYS)')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Report what would be archived without writing or deleting')
+
+    def handle(self, *args, **options):
+        if options['days'] is not None:
+            cutoff = timezone.now() - timedelta(days=options['days'])
+        else:
+            cutoff = archive_cutoff()
+
+        stats = archive_readings(cutoff=cutoff, dry_run=options['dry_run'])
+
+        for path in stats['files']:
+            self.stdout.write(str(path))
+        verb = 'Would archive' if options['dry_run'] else 'Archived'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {stats["rows"]} reading(s) older than {cutoff:%Y-%m-%d} '
+            f'into {len(stats["files"])} file(s)'
+        ))
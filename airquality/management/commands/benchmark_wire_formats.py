@@ -0,0 +1,61 @@
+"""
+Compare payload size and serialization time of the readings wire formats.
+"""
+import gzip
+import time
+
+import numpy as np
+import pandas as pd
+from django.core.management.base import BaseCommand
+
+from airquality.renderers import FORMAT_PARAMS, encode, msgpack
+from airquality.trends import POLLUTANT_FIELDS
+
+
+def synthetic_series(rows, step_minutes=15, seed=0):
+    """A multi-day series for one station, shaped like AirQualityReading rows"""
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=rows, freq=f'{step_minutes}min', tz='UTC'),
+        'location': 'Delhi',
+    })
+    for field in POLLUTANT_FIELDS:
+        frame[field] = rng.gamma(4.0, 20.0, rows).round(1)
+    frame['aqi_value'] = frame['aqi_value'].astype('int64')
+    return frame
+
+
+class Command(BaseCommand):
+    help = 'Benchmark payload size and encode time for json/msgpack/columnar readings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=7 * 24 * 4,
+                            help='Readings in the series (default: one week at 15 min)')
+        parser.add_argument('--repeat', type=int, default=20,
+                            help='Encodes per format; the best time is reported')
+
+    def handle(self, *args, **options):
+        frame = synthetic_series(options['rows'])
+        fields = ['location'] + POLLUTANT_FIELDS
+
+        self.stdout.write(f'{options["rows"]} readings, {len(fields) + 1} fields\n')
+        self.stdout.write(f'{"format":<18}{"bytes":>10}{"gzip":>10}{"encode ms":>12}{"vs json":>10}')
+
+        baseline = None
+        for name, media_type in FORMAT_PARAMS.items():
+            if 'msgpack' in name and msgpack is None:
+                self.stdout.write(f'{name:<18}  skipped (msgpack not installed)')
+                continue
+
+            timings = []
+            for _ in range(options['repeat']):
+                started = time.perf_counter()
+                payload = encode(frame, fields, media_type)
+                timings.append(time.perf_counter() - started)
+
+            size = len(payload)
+            baseline = baseline or size
+            self.stdout.write(
+                f'{name:<18}{size:>10}{len(gzip.compress(payload)):>10}'
+                f'{min(timings) * 1000:>12.2f}{size / baseline:>9.0%}'
+            )
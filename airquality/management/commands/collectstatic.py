@@ -0,0 +1,23 @@
+"""
+collectstatic that first pulls inline template assets out into static files,
+so they are picked up by the manifest storage (hashed names, .gz/.br copies).
+"""
+from django.contrib.staticfiles.management.commands.collectstatic import Command as CollectStaticCommand
+
+from .extract_inline_assets import extract_all
+
+
+class Command(CollectStaticCommand):
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--skip-inline-extraction', action='store_true',
+                            help='Do not extract inline template assets before collecting')
+
+    def handle(self, **options):
+        if not options['skip_inline_extraction'] and not options['dry_run']:
+            results = extract_all()
+            total = sum(len(assets) for assets in results.values())
+            if total and options['verbosity'] >= 1:
+                self.stdout.write(f'Extracted {total} inline block(s) from templates')
+        return super().handle(**options)
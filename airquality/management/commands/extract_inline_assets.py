@@ -0,0 +1,111 @@
+"""
+Move inline <style>/<script> blocks out of the airquality templates into
+static files so they can be fingerprinted, precompressed and cached.
+"""
+import hashlib
+import re
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+APP_DIR = Path(__file__).resolve().parent.parent.parent
+TEMPLATE_DIR = APP_DIR / 'templates' / 'airquality'
+STATIC_DIR = APP_DIR / 'static'
+ASSET_PREFIX = 'airquality/inline'
+
+# Blocks smaller than this stay inline; an extra request costs more than it saves
+DEFAULT_MIN_BYTES = 512
+
+BLOCK_RE = re.compile(r'<(style|script)\b([^>]*)>(.*?)</\1\s*>', re.IGNORECASE | re.DOTALL)
+TYPE_RE = re.compile(r'^\s*type\s*=\s*["\']?text/(css|javascript)["\']?\s*$', re.IGNORECASE)
+TEMPLATE_SYNTAX = ('{{', '{%', '{#')
+LOAD_STATIC = '{% load static %}'
+
+
+def _is_extractable(tag, attrs, body, min_bytes):
+    """Only plain blocks without Django template syntax can become static files"""
+    if attrs.strip() and not TYPE_RE.match(attrs):
+        return False
+    if any(marker in body for marker in TEMPLATE_SYNTAX):
+        return False
+    return len(body.strip().encode('utf-8')) >= min_bytes
+
+
+def extract_template(template_path, min_bytes=DEFAULT_MIN_BYTES, dry_run=False):
+    """
+    Rewrite one template, replacing inline blocks with {% static %} references.
+
+    Assets are named after the template and a digest of their content, so
+    re-running is idempotent and unchanged blocks keep the same file.
+    Returns the list of static paths that were (or would be) written.
+    """
+    source = template_path.read_text(encoding='utf-8')
+    written = []
+
+    def replace(match):
+        tag, attrs, body = match.group(1).lower(), match.group(2), match.group(3)
+        if not _is_extractable(tag, attrs, body, min_bytes):
+            return match.group(0)
+
+        content = body.strip('\r\n') + '\n'
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:10]
+        ext = 'css' if tag == 'style' else 'js'
+        name = f'{ASSET_PREFIX}/{template_path.stem}-{digest}.{ext}'
+        written.append(name)
+
+        if not dry_run:
+            target = STATIC_DIR / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content, encoding='utf-8')
+
+        if tag == 'style':
+            return f'<link rel="stylesheet" href="{{% static \'{name}\' %}}">'
+        return f'<script src="{{% static \'{name}\' %}}"></script>'
+
+    rewritten = BLOCK_RE.sub(replace, source)
+
+    if written and LOAD_STATIC not in rewritten:
+        # Keep a leading BOM in place so the file stays byte-compatible
+        bom = '\ufeff' if rewritten.startswith('\ufeff') else ''
+        rewritten = f'{bom}{LOAD_STATIC}\n{rewritten[len(bom):]}'
+
+    if written and not dry_run:
+        template_path.write_text(rewritten, encoding='utf-8')
+    return written
+
+
+def extract_all(min_bytes=DEFAULT_MIN_BYTES, dry_run=False):
+    """Run the extractor over every airquality template"""
+    results = {}
+    for template_path in sorted(TEMPLATE_DIR.glob('*.html')):
+        written = extract_template(template_path, min_bytes=min_bytes, dry_run=dry_run)
+        if written:
+            results[template_path.name] = written
+    return results
+
+
+class Command(BaseCommand):
+    help = 'Extract inline <style>/<script> blocks from airquality templates into static files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--min-bytes', type=int, default=DEFAULT_MIN_BYTES,
+                            help='Leave blocks smaller than this inline (default: %(default)s)')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Report what would be extracted without writing anything')
+        parser.add_argument('--check', action='store_true',
+                            help='Exit with an error if any template still has extractable blocks')
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run'] or options['check']
+        results = extract_all(min_bytes=options['min_bytes'], dry_run=dry_run)
+
+        for template, assets in results.items():
+            for asset in assets:
+                self.stdout.write(f'{template} -> {asset}')
+
+        if options['check'] and results:
+            raise CommandError('Inline assets found; run "manage.py extract_inline_assets"')
+
+        total = sum(len(assets) for assets in results.values())
+        verb = 'Found' if dry_run else 'Extracted'
+        self.stdout.write(self.style.SUCCESS(f'{verb} {total} inline block(s)'))
@@ -0,0 +1,160 @@
+"""
+Measure worker cold start: per-module import time for pollution_project.wsgi
+and the time to boot and serve a first request in a fresh interpreter.
+
+    python manage.py profile_startup
+    python manage.py profile_startup --runs 5 --record benchmarks/cold_start.jsonl
+"""
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from airquality.lazy import HEAVY_MODULES
+
+# Run in a child interpreter so nothing is already imported
+BOOT_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from pollution_project.wsgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+booted = time.perf_counter()
+
+from wsgiref.util import setup_testing_defaults
+environ = {'PATH_INFO': sys.argv[1], 'HTTP_HOST': 'localhost'}
+setup_testing_defaults(environ)
+status = []
+body = b''.join(application(environ, lambda s, h, *a: status.append(s)))
+served = time.perf_counter()
+
+print(json.dumps({
+    'boot_ms': (booted - started) * 1000,
+    'first_request_ms': (served - booted) * 1000,
+    'status': status[0] if status else None,
+    'heavy_loaded': sorted(m for m in sys.argv[2].split(',') if m in sys.modules),
+}))
+"""
+
+IMPORT_SCRIPT = (
+    'from pollution_project.wsgi import application\n'
+    'from django.urls import get_resolver\n'
+    'get_resolver().url_patterns\n'
+)
+
+
+def _child_env():
+    env = os.environ.copy()
+    env.setdefault('DJANGO_SETTINGS_MODULE', 'pollution_project.settings')
+    return env
+
+
+def import_times():
+    """[(module, self_us, cumulative_us, depth)] parsed from ``python -X importtime``"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_SCRIPT],
+        cwd=settings.BASE_DIR, env=_child_env(), capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise CommandError(f'Importing pollution_project.wsgi failed:\n{result.stderr[-2000:]}')
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        # Nesting is shown by indentation: one leading space, plus two per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def cold_start(path):
+    result = subprocess.run(
+        [sys.executable, '-c', BOOT_SCRIPT, path, ','.join(HEAVY_MODULES)],
+        cwd=settings.BASE_DIR, env=_child_env(), capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise CommandError(f'Cold start run failed:\n{result.stderr[-2000:]}')
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'describe', '--always', '--dirty'],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = 'Profile import time and cold start of pollution_project.wsgi'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=20,
+                            help='Modules to list, slowest first (default: %(default)s)')
+        parser.add_argument('--runs', type=int, default=3,
+                            help='Fresh interpreters to time; the median is reported')
+        parser.add_argument('--path', default='/api/auth/check/',
+                            help='URL requested as the first request (default: %(default)s)')
+        parser.add_argument('--record', metavar='FILE',
+                            help='Append the result as a JSON line to FILE')
+        parser.add_argument('--max-boot-ms', type=float,
+                            help='Fail if the median boot time exceeds this')
+
+    def handle(self, *args, **options):
+        rows = import_times()
+        total_ms = sum(row[2] for row in rows if row[3] == 0) / 1000
+
+        self.stdout.write(f'Import time of pollution_project.wsgi: {total_ms:.0f} ms\n')
+        self.stdout.write(f'{"module":<50}{"self ms":>10}{"cumul. ms":>12}')
+        for name, self_us, cumulative_us, _ in sorted(rows, key=lambda row: row[1], reverse=True)[:options['top']]:
+            self.stdout.write(f'{name:<50}{self_us / 1000:>10.1f}{cumulative_us / 1000:>12.1f}')
+
+        runs = [cold_start(options['path']) for _ in range(max(1, options['runs']))]
+        boot_ms = statistics.median(run['boot_ms'] for run in runs)
+        first_request_ms = statistics.median(run['first_request_ms'] for run in runs)
+        heavy = sorted({name for run in runs for name in run['heavy_loaded']})
+
+        self.stdout.write('')
+        self.stdout.write(f'Cold start over {len(runs)} run(s), median:')
+        self.stdout.write(f'  boot (import wsgi + URLconf): {boot_ms:.0f} ms')
+        self.stdout.write(f'  first request {options["path"]} ({runs[0]["status"]}): {first_request_ms:.0f} ms')
+        if heavy:
+            self.stdout.write(self.style.WARNING(f'  heavy modules imported at boot: {", ".join(heavy)}'))
+        else:
+            self.stdout.write('  heavy modules imported at boot: none')
+
+        if options['record']:
+            record = {
+                'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'revision': _git_revision(),
+                'python': platform.python_version(),
+                'import_ms': round(total_ms, 1),
+                'boot_ms': round(boot_ms, 1),
+                'first_request_ms': round(first_request_ms, 1),
+                'path': options['path'],
+                'runs': len(runs),
+                'heavy_loaded': heavy,
+            }
+            if not record['revision'] or record['revision'].endswith('-dirty'):
+                self.stdout.write(self.style.WARNING(
+                    'Recording from a tree with uncommitted changes; the entry cannot be reproduced'
+                ))
+            path = Path(options['record'])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open('a', encoding='utf-8') as handle:
+                handle.write(json.dumps(record) + '\n')
+            self.stdout.write(f'Recorded in {path}')
+
+        if options['max_boot_ms'] is not None and boot_ms > options['max_boot_ms']:
+            raise CommandError(f'Boot took {boot_ms:.0f} ms, above the {options["max_boot_ms"]:.0f} ms budget')
@@ -0,0 +1,249 @@
+"""
+Bulk-create user accounts from a CSV or NDJSON file.
+
+Duplicate usernames/emails are found with a few set-based queries instead of
+one query per user, passwords are hashed in a process pool (hashing is the
+expensive, CPU-bound part), and rows are inserted with bulk_create.
+
+CSV needs a header row; both formats use the keys
+username, email, password, first_name, last_name and optionally location.
+"""
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+from airquality.models import UserProfile
+
+REQUIRED_FIELDS = ['username', 'email', 'password']
+OPTIONAL_FIELDS = ['first_name', 'last_name', 'location']
+MIN_PASSWORD_LENGTH = 8
+
+# Longest value each column accepts; longer values would fail the whole INSERT
+MAX_LENGTHS = {
+    'username': User._meta.get_field('username').max_length,
+    'email': User._meta.get_field('email').max_length,
+    'first_name': User._meta.get_field('first_name').max_length,
+    'last_name': User._meta.get_field('last_name').max_length,
+    'location': UserProfile._meta.get_field('location').max_length,
+}
+
+# Keep IN (...) lists under SQLite's bound-parameter limit
+LOOKUP_CHUNK = 500
+
+
+def _init_worker(settings_module):
+    """Make Django usable in pool workers started with 'spawn'"""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    django.setup()
+
+
+def _hash_password(password):
+    return make_password(password)
+
+
+def read_rows(path, fmt):
+    """Yield (line number, dict) pairs from a CSV or NDJSON file"""
+    with open(path, newline='', encoding='utf-8-sig') as handle:
+        if fmt == 'csv':
+            reader = csv.DictReader(handle)
+            for row in reader:
+                yield reader.line_num, row
+        else:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except json.JSONDecodeError:
+                    yield line_number, None
+
+
+def _existing(field, values):
+    """Which of ``values`` already exist in User.<field>, checked in chunks"""
+    values = list(values)
+    found = set()
+    for start in range(0, len(values), LOOKUP_CHUNK):
+        chunk = values[start:start + LOOKUP_CHUNK]
+        found.update(User.objects.filter(**{f'{field}__in': chunk}).values_list(field, flat=True))
+    return found
+
+
+class Command(BaseCommand):
+    help = 'Create users in bulk from a CSV or NDJSON file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV (with header) or NDJSON file of users')
+        parser.add_argument('--format', choices=['csv', 'ndjson'],
+                            help='Input format (default: from the file extension)')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='Processes used for password hashing (default: CPU count)')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Rows per INSERT (default: %(default)s)')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Validate and hash without writing to the database')
+
+    def handle(self, *args, **options):
+        path = Path(options['path'])
+        if not path.exists():
+            raise CommandError(f'File not found: {path}')
+        fmt = options['format'] or ('csv' if path.suffix.lower() == '.csv' else 'ndjson')
+
+        started = time.perf_counter()
+        candidates, errors = self._validate(path, fmt)
+        self._drop_existing(candidates, errors)
+
+        hash_started = time.perf_counter()
+        passwords = [row['password'] for _, row in candidates]
+        hashed = self._hash_all(passwords, options['workers'])
+        hash_seconds = time.perf_counter() - hash_started
+
+        created = 0
+        if not options['dry_run'] and candidates:
+            created = self._insert(candidates, hashed, options['batch_size'], errors)
+
+        total_seconds = time.perf_counter() - started
+        self._report(candidates, created, errors, hash_seconds, total_seconds, options['dry_run'])
+
+    def _validate(self, path, fmt):
+        """Per-row checks, including duplicates within the file itself"""
+        candidates, errors = [], []
+        seen_usernames, seen_emails = set(), set()
+
+        for line, row in read_rows(path, fmt):
+            if not isinstance(row, dict):
+                errors.append((line, 'Invalid row'))
+                continue
+            row = {key: (value.strip() if isinstance(value, str) and key != 'password' else value)
+                   for key, value in row.items()}
+            # The same normalization create_user applies, so look-alikes of
+            # existing accounts are caught as duplicates
+            if isinstance(row.get('username'), str):
+                row['username'] = User.normalize_username(row['username'])
+            if isinstance(row.get('email'), str):
+                row['email'] = User.objects.normalize_email(row['email'])
+
+            missing = [field for field in REQUIRED_FIELDS if not row.get(field)]
+            not_text = [field for field in REQUIRED_FIELDS + OPTIONAL_FIELDS
+                        if row.get(field) is not None and not isinstance(row[field], str)]
+            too_long = [field for field, max_length in MAX_LENGTHS.items()
+                        if isinstance(row.get(field), str) and len(row[field]) > max_length]
+            if missing:
+                errors.append((line, f'Missing field(s): {", ".join(missing)}'))
+            elif not_text:
+                errors.append((line, f'Field(s) must be text: {", ".join(not_text)}'))
+            elif too_long:
+                errors.append((line, ', '.join(
+                    f'{field} must be at most {MAX_LENGTHS[field]} characters' for field in too_long
+                )))
+            elif len(row['password']) < MIN_PASSWORD_LENGTH:
+                errors.append((line, f'Password must be at least {MIN_PASSWORD_LENGTH} characters long'))
+            elif row['username'] in seen_usernames:
+                errors.append((line, f'Duplicate username in file: {row["username"]}'))
+            elif row['email'] in seen_emails:
+                errors.append((line, f'Duplicate email in file: {row["email"]}'))
+            else:
+                seen_usernames.add(row['username'])
+                seen_emails.add(row['email'])
+                candidates.append((line, row))
+        return candidates, errors
+
+    def _drop_existing(self, candidates, errors):
+        """Remove rows whose username/email is already taken, in place"""
+        taken_usernames = _existing('username', (row['username'] for _, row in candidates))
+        taken_emails = _existing('email', (row['email'] for _, row in candidates))
+
+        kept = []
+        for line, row in candidates:
+            if row['username'] in taken_usernames:
+                errors.append((line, f'Username already exists: {row["username"]}'))
+            elif row['email'] in taken_emails:
+                errors.append((line, f'Email already exists: {row["email"]}'))
+            else:
+                kept.append((line, row))
+        candidates[:] = kept
+
+    def _hash_all(self, passwords, workers):
+        if workers <= 1 or len(passwords) < 2:
+            return [_hash_password(password) for password in passwords]
+
+        chunksize = max(1, len(passwords) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(os.environ['DJANGO_SETTINGS_MODULE'],)) as pool:
+            return list(pool.map(_hash_password, passwords, chunksize=chunksize))
+
+    def _insert(self, candidates, hashed, batch_size, errors):
+        created = 0
+        for start in range(0, len(candidates), batch_size):
+            batch = candidates[start:start + batch_size]
+            passwords = hashed[start:start + batch_size]
+            try:
+                created += self._insert_batch(batch, passwords)
+            except IntegrityError:
+                # Someone registered one of these names since the duplicate
+                # check; retry row by row so only the conflicting rows fail
+                created += self._insert_rows(batch, passwords, errors)
+        return created
+
+    def _insert_batch(self, batch, passwords):
+        users = [
+            User(
+                username=row['username'],
+                email=row['email'],
+                password=password,
+                first_name=row.get('first_name') or '',
+                last_name=row.get('last_name') or '',
+            )
+            for (_, row), password in zip(batch, passwords)
+        ]
+        with transaction.atomic():
+            User.objects.bulk_create(users)
+            self._create_profiles(batch)
+        return len(users)
+
+    def _insert_rows(self, batch, passwords, errors):
+        created = 0
+        for row, password in zip(batch, passwords):
+            try:
+                created += self._insert_batch([row], [password])
+            except IntegrityError as e:
+                errors.append((row[0], f'Rejected by database: {e}'))
+        return created
+
+    def _create_profiles(self, batch):
+        """Profiles for rows that carry a location"""
+        locations = {row['username']: row['location'] for _, row in batch if row.get('location')}
+        if not locations:
+            return
+        user_ids = User.objects.filter(username__in=list(locations)).values_list('username', 'id')
+        UserProfile.objects.bulk_create([
+            UserProfile(user_id=user_id, location=locations[username])
+            for username, user_id in user_ids
+        ])
+
+    def _report(self, candidates, created, errors, hash_seconds, total_seconds, dry_run):
+        for line, message in sorted(errors, key=lambda error: error[0] or 0):
+            self.stderr.write(f'line {line}: {message}')
+
+        hashed = len(candidates)
+        hash_rate = hashed / hash_seconds if hash_seconds else 0
+        self.stdout.write(f'Hashed {hashed} password(s) in {hash_seconds:.2f}s ({hash_rate:.0f}/s)')
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(
+                f'Dry run: {hashed} user(s) would be created, {len(errors)} error(s)'
+            ))
+            return
+
+        rate = created / total_seconds if total_seconds else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {created} user(s) in {total_seconds:.2f}s ({rate:.0f}/s), {len(errors)} error(s)'
+        ))
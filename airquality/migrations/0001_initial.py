@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AirQualityReading',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('location', models.CharField(max_length=100)),
+                ('aqi_value', models.IntegerField()),
+                ('pm25', models.FloatField()),
+                ('pm10', models.FloatField()),
+                ('no2', models.FloatField(blank=True, null=True)),
+                ('so2', models.FloatField(blank=True, null=True)),
+                ('co', models.FloatField(blank=True, null=True)),
+                ('o3', models.FloatField(blank=True, null=True)),
+                ('temperature', models.FloatField(blank=True, null=True)),
+                ('humidity', models.FloatField(blank=True, null=True)),
+                ('wind_speed', models.FloatField(blank=True, null=True)),
+                ('visibility', models.FloatField(blank=True, null=True)),
+                ('timestamp', models.DateTimeField(db_index=True)),
+                ('data_source', models.CharField(blank=True, max_length=50)),
+            ],
+            options={
+                'ordering': ['-timestamp'],
+                'indexes': [models.Index(fields=['location', 'timestamp'], name='airquality__locatio_3c3221_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('airquality', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='airqualityreading',
+            name='quality_flags',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:37
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def remove_duplicate_slots(apps, schema_editor):
+    """Keep one reading per sensor slot, preferring real readings over gap fillers"""
+    AirQualityReading = apps.get_model('airquality', 'AirQualityReading')
+    duplicates = (AirQualityReading.objects
+                  .values('location', 'data_source', 'timestamp')
+                  .annotate(n=Count('id'))
+                  .filter(n__gt=1))
+    for slot in duplicates.iterator():
+        # The interpolated flag is the highest bit, so real readings sort first
+        ids = list(AirQualityReading.objects
+                   .filter(location=slot['location'], data_source=slot['data_source'],
+                           timestamp=slot['timestamp'])
+                   .order_by('quality_flags', 'id')
+                   .values_list('id', flat=True))
+        AirQualityReading.objects.filter(id__in=ids[1:]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('airquality', '0004_user_profiles_and_recommendations'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_slots, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='airqualityreading',
+            constraint=models.UniqueConstraint(fields=('location', 'data_source', 'timestamp'), name='unique_reading_per_sensor_slot'),
+        ),
+    ]
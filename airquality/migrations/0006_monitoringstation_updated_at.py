@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('airquality', '0005_reading_unique_slot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='monitoringstation',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -1,3 +1,130 @@
+from django.conf import settings
 from django.db import models
 
 # Create your models here.
+
+class AirQualityReading(models.Model):
+    """A single air quality observation for a monitoring location"""
+    # Bits of quality_flags, set by airquality.quality on ingest
+    QUALITY_SPIKE = 1
+    QUALITY_STUCK = 2
+    QUALITY_INTERPOLATED = 4
+    QUALITY_FLAG_NAMES = {
+        QUALITY_SPIKE: 'spike',
+        QUALITY_STUCK: 'stuck',
+        QUALITY_INTERPOLATED: 'interpolated',
+    }
+
+    location = models.CharField(max_length=100)
+    aqi_value = models.IntegerField()
+    pm25 = models.FloatField()
+    pm10 = models.FloatField()
+    no2 = models.FloatField(null=True, blank=True)
+    so2 = models.FloatField(null=True, blank=True)
+    co = models.FloatField(null=True, blank=True)
+    o3 = models.FloatField(null=True, blank=True)
+    temperature = models.FloatField(null=True, blank=True)
+    humidity = models.FloatField(null=True, blank=True)
+    wind_speed = models.FloatField(null=True, blank=True)
+    visibility = models.FloatField(null=True, blank=True)
+    timestamp = models.DateTimeField(db_index=True)
+    data_source = models.CharField(max_length=50, blank=True)
+    quality_flags = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['location', 'timestamp']),
+        ]
+        constraints = [
+            # One reading per sensor and slot, so gap fillers can't duplicate real readings
+            models.UniqueConstraint(fields=['location', 'data_source', 'timestamp'],
+                                    name='unique_reading_per_sensor_slot'),
+        ]
+
+    @property
+    def quality_flag_names(self):
+        return [name for bit, name in self.QUALITY_FLAG_NAMES.items() if self.quality_flags & bit]
+
+    def __str__(self):
+        return f'{self.location} AQI {self.aqi_value} @ {self.timestamp:%Y-%m-%d %H:%M}'
+
+
+class MonitoringStation(models.Model):
+    """Coordinates of a monitoring location; ``name`` matches AirQualityReading.location"""
+    name = models.CharField(max_length=100, unique=True)
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+    is_active = models.BooleanField(default=True)
+    # Part of the heatmap tile version, so edits re-render tiles
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class UserProfile(models.Model):
+    """Per-user settings used to personalise the dashboard"""
+    HEALTH_CONDITIONS = [
+        ('asthma', 'Asthma'),
+        ('copd', 'COPD'),
+        ('heart_disease', 'Heart disease'),
+        ('diabetes', 'Diabetes'),
+        ('pregnancy', 'Pregnancy'),
+        ('elderly', 'Age 65+'),
+        ('children', 'Children in household'),
+    ]
+
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='profile')
+    location = models.CharField(max_length=100, blank=True)
+    health_conditions = models.JSONField(default=list, blank=True)
+
+    def __str__(self):
+        return f'Profile of {self.user}'
+
+    @property
+    def locations(self):
+        """Home location first, then saved locations, without duplicates"""
+        names = [self.location] if self.location else []
+        for saved in self.user.saved_locations.all():
+            if saved.location not in names:
+                names.append(saved.location)
+        return names
+
+
+class SavedLocation(models.Model):
+    """A location a user follows on their dashboard"""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='saved_locations')
+    location = models.CharField(max_length=100, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'location'], name='unique_saved_location'),
+        ]
+
+    def __str__(self):
+        return f'{self.user}: {self.location}'
+
+
+class HealthRecommendation(models.Model):
+    """Advice shown when AQI falls within a range, optionally for given conditions"""
+    aqi_min = models.IntegerField(default=0)
+    aqi_max = models.IntegerField(default=500)
+    recommendation = models.TextField()
+    severity_level = models.CharField(max_length=20)
+    icon_class = models.CharField(max_length=50, blank=True)
+    activity_type = models.CharField(max_length=50, blank=True)
+    # Empty means the advice applies to everyone
+    target_conditions = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['aqi_min']
+
+    def __str__(self):
+        return f'{self.aqi_min}-{self.aqi_max}: {self.recommendation[:40]}'
@@ -0,0 +1,221 @@
+"""
+Streaming data quality checks for incoming sensor readings.
+
+Each sensor (location + data source) keeps a small, fixed-size state per
+pollutant: Welford running mean/variance and a bounded window for a rolling
+median. Every reading is checked in O(1) against that state, without looking
+at the database:
+
+- out of range values are rejected
+- spikes (far from the rolling median) are flagged, or rejected if configured
+- stuck sensors (the same value repeated) are flagged
+- short gaps since the previous reading are filled by linear interpolation
+
+State is per process, so several workers can each interpolate the same gap;
+airquality.ingest skips fillers for slots that are already stored.
+"""
+import math
+import threading
+from collections import deque
+from datetime import timedelta
+from statistics import median
+
+from django.conf import settings
+
+from .models import AirQualityReading
+
+# Fields checked for quality; the others are passed through untouched
+QUALITY_FIELDS = ['aqi_value', 'pm25', 'pm10', 'no2', 'so2', 'co', 'o3']
+
+# Physically plausible bounds, anything outside is a sensor fault
+VALID_RANGES = {
+    'aqi_value': (0, 1000),
+    'pm25': (0, 2000),
+    'pm10': (0, 3000),
+    'no2': (0, 2000),
+    'so2': (0, 2000),
+    'co': (0, 200),
+    'o3': (0, 1000),
+}
+
+DEFAULTS = {
+    'WINDOW': 11,              # readings kept for the rolling median
+    'MIN_SAMPLES': 5,          # readings needed before spikes are judged
+    'SPIKE_SIGMAS': 4.0,       # distance from the median, in standard deviations
+    'STUCK_REPEATS': 6,        # identical consecutive values before flagging
+    'INTERVAL_SECONDS': 900,   # expected reporting interval
+    'MAX_FILL_INTERVALS': 4,   # longest gap (in intervals) that is interpolated
+    'REJECT_SPIKES': False,
+}
+
+
+def quality_setting(name):
+    return getattr(settings, 'AIRQUALITY_QUALITY', {}).get(name, DEFAULTS[name])
+
+
+class FieldStats:
+    """Rolling statistics for one pollutant of one sensor"""
+    __slots__ = ('count', 'mean', 'm2', 'window', 'last', 'repeats')
+
+    def __init__(self, window):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.window = deque(maxlen=window)
+        self.last = None
+        self.repeats = 0
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def update(self, value, moments=True):
+        """Welford update plus window/stuck bookkeeping"""
+        if moments:
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (value - self.mean)
+        self.window.append(value)
+        self.repeats = self.repeats + 1 if value == self.last else 1
+        self.last = value
+
+    def is_spike(self, value, min_samples, sigmas):
+        if self.count < min_samples:
+            return False
+        # Floor the scale so perfectly flat history doesn't flag every change
+        scale = max(self.std, 0.05 * abs(self.mean), 1.0)
+        return abs(value - median(self.window)) > sigmas * scale
+
+
+class SensorState:
+    """Per-sensor state: one FieldStats per quality field and the last reading"""
+    __slots__ = ('fields', 'last_reading')
+
+    def __init__(self, window):
+        self.fields = {field: FieldStats(window) for field in QUALITY_FIELDS}
+        self.last_reading = None
+
+
+class QualityPipeline:
+    """
+    Validates readings as they stream in, keeping per-sensor state in memory.
+
+    ``process`` returns the readings to persist: interpolated gap fillers
+    followed by the reading itself, or nothing if the reading is rejected.
+    """
+
+    def __init__(self):
+        self.sensors = {}
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def sensor_key(reading):
+        return (reading.location, reading.data_source)
+
+    def has_sensor(self, key):
+        return key in self.sensors
+
+    def _state(self, key):
+        state = self.sensors.get(key)
+        if state is None:
+            state = self.sensors[key] = SensorState(quality_setting('WINDOW'))
+        return state
+
+    def seed(self, key, history):
+        """Prime a sensor's state from recent readings (oldest first)"""
+        with self._lock:
+            state = self._state(key)
+            for reading in history:
+                self._observe(state, reading)
+
+    def _observe(self, state, reading, moments=True):
+        for field in QUALITY_FIELDS:
+            value = getattr(reading, field)
+            if value is not None:
+                state.fields[field].update(float(value), moments)
+        # A late reading must not move the gap-fill anchor backwards, or the
+        # next reading would re-fill slots that are already stored
+        if state.last_reading is None or reading.timestamp > state.last_reading.timestamp:
+            state.last_reading = reading
+
+    def _out_of_range(self, reading):
+        for field in QUALITY_FIELDS:
+            value = getattr(reading, field)
+            if value is None:
+                continue
+            low, high = VALID_RANGES[field]
+            # NaN fails both comparisons, so it is rejected here too
+            if not low <= value <= high:
+                return True
+        return False
+
+    def _fill_gap(self, state, reading):
+        """Linearly interpolated readings for a short gap before ``reading``"""
+        previous = state.last_reading
+        if previous is None or reading.timestamp <= previous.timestamp:
+            return []
+
+        interval = timedelta(seconds=quality_setting('INTERVAL_SECONDS'))
+        missing = int((reading.timestamp - previous.timestamp) / interval) - 1
+        if missing < 1 or missing >= quality_setting('MAX_FILL_INTERVALS'):
+            return []
+
+        fillers = []
+        for step in range(1, missing + 1):
+            ratio = step / (missing + 1)
+            values = {}
+            for field in QUALITY_FIELDS + ['temperature', 'humidity', 'wind_speed', 'visibility']:
+                start, end = getattr(previous, field), getattr(reading, field)
+                if start is None or end is None:
+                    values[field] = None
+                else:
+                    values[field] = start + (end - start) * ratio
+            values['aqi_value'] = round(values['aqi_value'])
+            fillers.append(AirQualityReading(
+                location=reading.location,
+                data_source=reading.data_source,
+                timestamp=previous.timestamp + interval * step,
+                quality_flags=AirQualityReading.QUALITY_INTERPOLATED,
+                **values
+            ))
+        return fillers
+
+    def process(self, reading):
+        with self._lock:
+            if self._out_of_range(reading):
+                self.rejected += 1
+                return []
+
+            state = self._state(self.sensor_key(reading))
+            min_samples = quality_setting('MIN_SAMPLES')
+            sigmas = quality_setting('SPIKE_SIGMAS')
+            stuck_repeats = quality_setting('STUCK_REPEATS')
+
+            flags = reading.quality_flags or 0
+            for field in QUALITY_FIELDS:
+                value = getattr(reading, field)
+                if value is None:
+                    continue
+                stats = state.fields[field]
+                if stats.is_spike(float(value), min_samples, sigmas):
+                    flags |= AirQualityReading.QUALITY_SPIKE
+                # Integer AQI legitimately repeats in stable air; raw concentrations don't
+                if field != 'aqi_value' and value == stats.last and stats.repeats + 1 >= stuck_repeats:
+                    flags |= AirQualityReading.QUALITY_STUCK
+
+            if flags & AirQualityReading.QUALITY_SPIKE and quality_setting('REJECT_SPIKES'):
+                self.rejected += 1
+                return []
+
+            reading.quality_flags = flags
+            accepted = self._fill_gap(state, reading) + [reading]
+            # Spikes still enter the median window, so a real level shift stops
+            # being flagged after a few readings, but they don't skew mean/variance
+            self._observe(state, reading, moments=not flags & AirQualityReading.QUALITY_SPIKE)
+            return accepted
+
+
+# One pipeline per process; state is rebuilt lazily after a restart
+pipeline = QualityPipeline()
@@ -0,0 +1,144 @@
+"""
+Wire formats for time-series responses.
+
+Readings can be returned in two layouts and two encodings:
+
+- ``rows``: one object per reading (the default)
+- ``columnar``: one array per field, timestamps delta-encoded as
+  ``{"base": <epoch seconds>, "deltas": [0, 900, 900, ...]}``
+
+each encoded as JSON or MessagePack. The format is picked from the Accept
+header, or overridden with ``?format=json|msgpack|columnar|columnar-msgpack``.
+"""
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import patch_vary_headers
+
+from .lazy import lazy_import
+
+pd = lazy_import('pandas')
+# Optional: MessagePack formats answer 406 when it isn't installed
+msgpack = lazy_import('msgpack', optional=True)
+
+JSON = 'application/json'
+MSGPACK = 'application/msgpack'
+COLUMNAR_JSON = 'application/vnd.airaware.columnar+json'
+COLUMNAR_MSGPACK = 'application/vnd.airaware.columnar+msgpack'
+
+# Media type -> (encoding, layout)
+MEDIA_TYPES = {
+    JSON: ('json', 'rows'),
+    MSGPACK: ('msgpack', 'rows'),
+    'application/x-msgpack': ('msgpack', 'rows'),
+    COLUMNAR_JSON: ('json', 'columnar'),
+    COLUMNAR_MSGPACK: ('msgpack', 'columnar'),
+}
+
+FORMAT_PARAMS = {
+    'json': JSON,
+    'msgpack': MSGPACK,
+    'columnar': COLUMNAR_JSON,
+    'columnar-msgpack': COLUMNAR_MSGPACK,
+}
+
+
+class NotAcceptable(Exception):
+    """Requested wire format is unknown or unavailable"""
+
+
+def negotiate(request):
+    """Return the media type to respond with; JSON unless the client asks otherwise"""
+    requested = request.GET.get('format')
+    if requested:
+        if requested not in FORMAT_PARAMS:
+            raise NotAcceptable(f'Unsupported format: {requested}')
+        media_type = FORMAT_PARAMS[requested]
+    else:
+        media_type = JSON
+        for accepted in request.accepted_types:
+            name = f'{accepted.main_type}/{accepted.sub_type}'
+            if name in MEDIA_TYPES:
+                media_type = name
+                break
+
+    if MEDIA_TYPES[media_type][0] == 'msgpack' and msgpack is None:
+        raise NotAcceptable('MessagePack is not available on this server')
+    return media_type
+
+
+def _epoch_seconds(timestamps):
+    """Aware timestamps as integer seconds since the Unix epoch"""
+    timestamps = pd.to_datetime(timestamps, utc=True)
+    return ((timestamps - pd.Timestamp(0, tz='UTC')) // pd.Timedelta(seconds=1)).astype('int64')
+
+
+def _column(series):
+    """A Series as a plain list with NaN/NaT replaced by None"""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def to_rows(frame, fields):
+    """Dict-per-reading layout"""
+    out = frame[['timestamp'] + fields].copy()
+    out['timestamp'] = pd.to_datetime(out['timestamp'], utc=True).map(lambda ts: ts.isoformat())
+    out = out.astype(object).where(out.notna(), None)
+    return out.to_dict('records')
+
+
+def to_columns(frame, fields):
+    """Array-per-field layout with delta-encoded timestamps"""
+    seconds = _epoch_seconds(frame['timestamp'])
+    base = int(seconds.iloc[0]) if len(seconds) else 0
+    return {
+        'count': len(frame),
+        'timestamp': {
+            'base': base,
+            'deltas': seconds.diff().fillna(0).astype('int64').tolist(),
+        },
+        'columns': {field: _column(frame[field]) for field in fields},
+    }
+
+
+def decode_timestamps(encoded):
+    """Inverse of the delta encoding used by ``to_columns`` (epoch seconds)"""
+    values, current = [], encoded['base']
+    for delta in encoded['deltas']:
+        current += delta
+        values.append(current)
+    return values
+
+
+def encode(frame, fields, media_type, meta=None):
+    """Serialize ``frame`` to bytes in the given media type"""
+    encoding, layout = MEDIA_TYPES[media_type]
+    payload = dict(meta or {})
+    payload['fields'] = ['timestamp'] + fields
+    if layout == 'columnar':
+        payload.update(to_columns(frame, fields))
+    else:
+        payload['count'] = len(frame)
+        payload['readings'] = to_rows(frame, fields)
+
+    if encoding == 'msgpack':
+        return msgpack.packb(payload, use_bin_type=True, default=str)
+    return json.dumps(payload, cls=DjangoJSONEncoder, separators=(',', ':')).encode('utf-8')
+
+
+def render_readings(request, frame, fields, meta=None, filename=None):
+    """HttpResponse for a readings DataFrame in the negotiated wire format"""
+    try:
+        media_type = negotiate(request)
+    except NotAcceptable as e:
+        return JsonResponse({
+            'error': str(e),
+            'supported': sorted(FORMAT_PARAMS)
+        }, status=406)
+
+    response = HttpResponse(encode(frame, fields, media_type, meta), content_type=media_type)
+    patch_vary_headers(response, ['Accept'])
+    if filename:
+        extension = 'msgpack' if MEDIA_TYPES[media_type][0] == 'msgpack' else 'json'
+        response['Content-Disposition'] = f'attachment; filename="{filename}.{extension}"'
+    return response
@@ -0,0 +1,20 @@
+  lucide.createIcons();
+
+  // Mobile menu toggle
+  document.getElementById('mobileMenuBtn').addEventListener('click', () => {
+    document.getElementById('mobileMenu').classList.toggle('hidden');
+  });
+
+  // Timer functionality
+  let seconds = 9252, running = true;
+  const timerEl = document.getElementById('timer');
+  function updateTimer() {
+    const h = String(Math.floor(seconds / 3600)).padStart(2,'0');
+    const m = String(Math.floor(seconds % 3600 / 60)).padStart(2,'0');
+    const s = String(seconds % 60).padStart(2,'0');
+    timerEl.textContent = `${h}:${m}:${s}`;
+  }
+  updateTimer();
+  let interval = setInterval(() => { if(running){ seconds++; updateTimer(); } }, 1000);
+  document.getElementById('pauseBtn').addEventListener('click', () => { running = !running; });
+  document.getElementById('stopBtn').addEventListener('click', () => { running = false; seconds = 0; updateTimer(); });
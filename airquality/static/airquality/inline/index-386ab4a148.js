@@ -0,0 +1,28 @@
+// Navigation functions for authentication pages
+window.showLoginPage = function() {
+  window.location.href = '/login/';
+};
+
+window.showSignupPage = function() {
+  window.location.href = '/signup/';
+};
+
+window.hideSignupPage = function() {
+  // No longer needed with redirects
+};
+
+// CSRF Token Helper Function
+function getCookie(name) {
+  let cookieValue = null;
+  if (document.cookie && document.cookie !== '') {
+    const cookies = document.cookie.split(';');
+    for (let i = 0; i < cookies.length; i++) {
+      const cookie = cookies[i].trim();
+      if (cookie.substring(0, name.length + 1) === (name + '=')) {
+        cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+        break;
+      }
+    }
+  }
+  return cookieValue;
+}
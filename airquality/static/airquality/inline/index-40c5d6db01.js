@@ -0,0 +1,811 @@
+// JavaScript for AirAware Platform - Django Authentication Integration
+// Note: Navigation functions (showLoginPage, showSignupPage) are defined in head section
+
+// React Components for authentication forms
+const LoginButton = ({ onClick, isLoading, children = "Login" }) => {
+  const ButtonComponent = motion ? motion.button : 'button';
+  
+  const props = {
+    type: "submit",
+    onClick: onClick,
+    className: `w-full py-4 bg-[#f0f3fa] rounded-2xl text-gray-700 text-lg mb-6 shadow-[8px_8px_16px_#d1d9e6,-8px_-8px_16px_#ffffff] hover:shadow-[6px_6px_12px_#d1d9e6,-6px_-6px_12px_#ffffff] active:shadow-[inset_4px_4px_8px_#d1d9e6,inset_-4px_-4px_8px_#ffffff] transition-all duration-200 font-mono font-normal ${
+      isLoading ? "opacity-50 cursor-not-allowed" : ""
+    }`,
+    style: { color: "#ff1493" },
+    disabled: isLoading
+  };
+
+  if (motion) {
+    props.whileHover = { scale: 1.02 };
+    props.whileTap = { scale: 0.98 };
+  }
+
+  return React.createElement(ButtonComponent, props, isLoading ? "Loading..." : children);
+};
+
+// Footer Links Component
+const FooterLinks = ({ onSwitchToLogin }) => {
+  return React.createElement('div', {
+    className: "flex justify-between items-center text-sm"
+  }, [
+    React.createElement('button', {
+      key: 'forgot',
+      className: "text-gray-500 hover:text-[#ff1493] hover:underline transition-all duration-200 font-mono"
+    }, "Forgot password?"),
+    React.createElement('button', {
+      key: 'switch',
+      onClick: onSwitchToLogin,
+      className: "text-gray-500 hover:text-[#ff1493] hover:underline transition-all duration-200 font-mono",
+      style: { marginLeft: "5px" }
+    }, "or Sign in")
+  ]);
+};
+
+// Main Login Card Component (for switching between signup/login)
+const NeumorphicLogin = ({ onClose, onSwitchToSignup }) => {
+  const [email, setEmail] = useState("");
+  const [password, setPassword] = useState("");
+  const [isLoading, setIsLoading] = useState(false);
+
+  const handleSubmit = async (e) => {
+    e.preventDefault();
+
+    if (!email || !password) {
+      alert("Please fill in both fields");
+      return;
+    }
+
+    if (!email.includes("@")) {
+      alert("Please enter a valid email address");
+      return;
+    }
+
+    setIsLoading(true);
+    await new Promise((resolve) => setTimeout(resolve, 1500));
+
+    localStorage.setItem("dummyUser", JSON.stringify({
+      email,
+      loginTime: new Date().toISOString(),
+    }));
+
+    alert("Successfully logged in!");
+    onClose();
+  };
+
+  const CardComponent = motion ? motion.div : 'div';
+  const cardProps = motion ? {
+    initial: { opacity: 0, y: 20 },
+    animate: { opacity: 1, y: 0 },
+    transition: { duration: 0.6 }
+  } : {};
+
+  return React.createElement('div', {
+    className: "w-full flex flex-col items-center"
+  }, [
+    React.createElement('div', {
+      key: 'header',
+      className: "flex justify-between items-center w-full mb-6"
+    }, [
+      React.createElement('h1', {
+        key: 'title',
+        className: "text-3xl font-mono font-black text-gray-500"
+      }, "Sign In"),
+      React.createElement('button', {
+        key: 'close',
+        onClick: onClose,
+        className: "text-gray-400 hover:text-gray-600 text-3xl transition-colors"
+      }, "×")
+    ]),
+    
+    React.createElement(CardComponent, {
+      key: 'card',
+      ...cardProps,
+      className: "w-full max-w-md mx-auto bg-[#f0f3fa] rounded-3xl p-8 shadow-[20px_20px_40px_#d1d9e6,-20px_-20px_40px_#ffffff] mt-4"
+    }, React.createElement('div', {
+      className: "flex flex-col items-center"
+    }, [
+      React.createElement(AvatarPlaceholder, { key: 'avatar' }),
+
+      React.createElement('form', {
+        key: 'form',
+        onSubmit: handleSubmit,
+        className: "w-full"
+      }, [
+        React.createElement(InputField, {
+          key: 'email',
+          type: "email",
+          placeholder: "Email",
+          value: email,
+          onChange: setEmail
+        }),
+        React.createElement(InputField, {
+          key: 'password',
+          type: "password",
+          placeholder: "Password",
+          value: password,
+          onChange: setPassword,
+          showPasswordToggle: true
+        }),
+        React.createElement(LoginButton, {
+          key: 'button',
+          onClick: handleSubmit,
+          isLoading: isLoading
+        })
+      ]),
+
+      React.createElement(FooterLinks, {
+        key: 'footer',
+        onSwitchToLogin: onSwitchToSignup
+      })
+    ]))
+  ]);
+};
+
+// Signup Form Component
+const SignupForm = ({ onClose, onSwitchToLogin }) => {
+  const [formData, setFormData] = useState({
+    firstName: '',
+    lastName: '',
+    email: '',
+    password: '',
+    confirmPassword: ''
+  });
+  const [isLoading, setIsLoading] = useState(false);
+
+  const handleChange = (field, value) => {
+    setFormData(prev => ({ ...prev, [field]: value }));
+  };
+
+  const handleSubmit = async (e) => {
+    e.preventDefault();
+
+    if (!formData.firstName || !formData.lastName || !formData.email || !formData.password) {
+      alert("Please fill in all fields");
+      return;
+    }
+
+    if (!formData.email.includes("@")) {
+      alert("Please enter a valid email address");
+      return;
+    }
+
+    if (formData.password !== formData.confirmPassword) {
+      alert("Passwords do not match");
+      return;
+    }
+
+    if (formData.password.length < 8) {
+      alert("Password must be at least 8 characters");
+      return;
+    }
+
+    setIsLoading(true);
+
+    try {
+      // Get CSRF token
+      const csrftoken = getCookie('csrftoken');
+      
+      // Call Django backend API
+      const response = await fetch('/api/auth/register/', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'X-CSRFToken': csrftoken,
+        },
+        credentials: 'same-origin',
+        body: JSON.stringify({
+          username: formData.email,
+          email: formData.email,
+          password: formData.password,
+          confirm_password: formData.confirmPassword,
+          first_name: formData.firstName,
+          last_name: formData.lastName,
+        }),
+      });
+
+      const data = await response.json();
+
+      if (!response.ok) {
+        // Handle validation errors
+        if (data.username) {
+          alert('Error: ' + data.username[0]);
+        } else if (data.email) {
+          alert('Error: ' + data.email[0]);
+        } else if (data.password) {
+          alert('Error: ' + data.password[0]);
+        } else if (data.error) {
+          alert('Error: ' + data.error);
+        } else {
+          alert('Registration failed. Please try again.');
+        }
+        setIsLoading(false);
+        return;
+      }
+
+      // Success! Store user info and redirect to dashboard
+      if (data.success) {
+        localStorage.setItem("user", JSON.stringify(data.user));
+        alert("Account created successfully! Welcome to AirAware!");
+        window.location.href = data.redirect_url || '/dashboard/';
+      } else {
+        alert("Registration successful!");
+        onClose();
+      }
+    } catch (error) {
+      console.error('Registration error:', error);
+      alert("Network error. Please make sure the server is running.");
+      setIsLoading(false);
+    }
+  };
+
+  const CardComponent = motion ? motion.div : 'div';
+  const cardProps = motion ? {
+    initial: { opacity: 0, y: 20 },
+    animate: { opacity: 1, y: 0 },
+    transition: { duration: 0.6 }
+  } : {};
+
+  return React.createElement('div', {
+    className: "w-full flex flex-col items-center"
+  }, [
+    React.createElement('div', {
+      key: 'header',
+      className: "flex justify-between items-center w-full mb-6"
+    }, [
+      React.createElement('h1', {
+        key: 'title',
+        className: "text-3xl font-mono font-black text-gray-500 mt-20"
+      }, "Sign Up"),
+      React.createElement('button', {
+        key: 'close',
+        onClick: onClose,
+        className: "text-gray-400 hover:text-gray-600 text-3xl transition-colors"
+      }, "×")
+    ]),
+    
+    React.createElement(CardComponent, {
+      key: 'card',
+      ...cardProps,
+      className: "w-full max-w-md mx-auto bg-[#f0f3fa] rounded-3xl p-8 shadow-[20px_20px_40px_#d1d9e6,-20px_-20px_40px_#ffffff] mt-4"
+    }, React.createElement('div', {
+      className: "flex flex-col items-center"
+    }, [
+      React.createElement(AvatarPlaceholder, { key: 'avatar' }),
+
+      React.createElement('form', {
+        key: 'form',
+        onSubmit: handleSubmit,
+        className: "w-full"
+      }, [
+        React.createElement('div', {
+          key: 'name-row',
+          className: "grid grid-cols-2 gap-4 mb-6"
+        }, [
+          React.createElement(InputField, {
+            key: 'firstName',
+            type: "text",
+            placeholder: "First Name",
+            value: formData.firstName,
+            onChange: (value) => handleChange('firstName', value)
+          }),
+          React.createElement(InputField, {
+            key: 'lastName',
+            type: "text",
+            placeholder: "Last Name",
+            value: formData.lastName,
+            onChange: (value) => handleChange('lastName', value)
+          })
+        ]),
+
+        React.createElement(InputField, {
+          key: 'email',
+          type: "email",
+          placeholder: "Email",
+          value: formData.email,
+          onChange: (value) => handleChange('email', value)
+        }),
+
+        React.createElement(InputField, {
+          key: 'password',
+          type: "password",
+          placeholder: "Password",
+          value: formData.password,
+          onChange: (value) => handleChange('password', value),
+          showPasswordToggle: true
+        }),
+
+        React.createElement(InputField, {
+          key: 'confirmPassword',
+          type: "password",
+          placeholder: "Confirm Password",
+          value: formData.confirmPassword,
+          onChange: (value) => handleChange('confirmPassword', value),
+          showPasswordToggle: true
+        }),
+
+        React.createElement(LoginButton, {
+          key: 'button',
+          onClick: handleSubmit,
+          isLoading: isLoading,
+          children: isLoading ? "Creating Account..." : "Create Account"
+        })
+      ]),
+
+      React.createElement('div', {
+        key: 'footer',
+        className: "flex justify-center items-center text-sm"
+      }, [
+        React.createElement('span', {
+          key: 'text',
+          className: "text-gray-500 mr-1"
+        }, "Already have an account?"),
+        React.createElement('button', {
+          key: 'switch',
+          onClick: onSwitchToLogin,
+          className: "text-gray-500 hover:text-[#ff1493] hover:underline transition-all duration-200 font-mono"
+        }, "Sign in")
+      ])
+    ]))
+  ]);
+};
+
+// Specific Signup Page Component (from authentication folder)
+const SignupPage = ({ onClose }) => {
+  const [formData, setFormData] = useState({
+    name: '',
+    email: '',
+    password: '',
+    confirmPassword: ''
+  });
+  const [isLoading, setIsLoading] = useState(false);
+
+  const handleChange = (field, value) => {
+    setFormData(prev => ({ ...prev, [field]: value }));
+  };
+
+  const handleSubmit = async (e) => {
+    e.preventDefault();
+    
+    if (!formData.name || !formData.email || !formData.password || !formData.confirmPassword) {
+      alert('Please fill in all fields');
+      return;
+    }
+    
+    if (!formData.email.includes('@')) {
+      alert('Please enter a valid email address');
+      return;
+    }
+    
+    if (formData.password !== formData.confirmPassword) {
+      alert('Passwords do not match');
+      return;
+    }
+    
+    if (formData.password.length < 8) {
+      alert('Password must be at least 8 characters');
+      return;
+    }
+    
+    setIsLoading(true);
+    
+    try {
+      // Parse name into first and last
+      const names = formData.name.trim().split(' ');
+      const firstName = names.shift() || '';
+      const lastName = names.join(' ') || '';
+
+      // Get CSRF token
+      const csrftoken = getCookie('csrftoken');
+
+      // Call Django backend API
+      const response = await fetch('/api/auth/register/', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'X-CSRFToken': csrftoken,
+        },
+        credentials: 'same-origin',
+        body: JSON.stringify({
+          username: formData.email,
+          email: formData.email,
+          password: formData.password,
+          confirm_password: formData.confirmPassword,
+          first_name: firstName,
+          last_name: lastName,
+        }),
+      });
+
+      const data = await response.json();
+
+      if (!response.ok) {
+        // Handle validation errors
+        if (data.username) {
+          alert('Error: ' + data.username[0]);
+        } else if (data.email) {
+          alert('Error: ' + data.email[0]);
+        } else if (data.password) {
+          alert('Error: ' + data.password[0]);
+        } else if (data.error) {
+          alert('Error: ' + data.error);
+        } else {
+          alert('Registration failed. Please try again.');
+        }
+        setIsLoading(false);
+        return;
+      }
+
+      // Success! Store user data and redirect to dashboard
+      if (data.success) {
+        localStorage.setItem('user', JSON.stringify(data.user));
+        alert('Account created successfully! Welcome to AirAware!');
+        window.location.href = data.redirect_url || '/dashboard/';
+      } else {
+        alert('Registration successful!');
+        if (onClose) onClose();
+      }
+    } catch (error) {
+      console.error('Registration error:', error);
+      alert('Network error. Please make sure the server is running.');
+      setIsLoading(false);
+    }
+  };
+
+  return (
+    <main className="min-h-dvh flex items-center justify-center px-4 py-10">
+      <div className="signup-container">
+        {/* Close button */}
+        <div className="flex justify-end mb-6">
+          <button
+            onClick={onClose}
+            className="auth-close-btn"
+          >
+            ×
+          </button>
+        </div>
+        
+        <div className="mb-8 space-y-4 text-center">
+          <span className="auth-badge">
+            AI-Powered Environmental Intelligence
+          </span>
+          <h1 className="auth-title">
+            Join AirAware
+          </h1>
+          <p className="auth-subtitle">
+            Create your account to get real-time AQI, source attribution, and proactive health alerts.
+          </p>
+        </div>
+
+        <div className="auth-form-container p-8">
+          <form className="grid gap-6" onSubmit={handleSubmit}>
+            <div className="grid gap-3">
+              <label htmlFor="name" className="auth-label">
+                Full Name
+              </label>
+              <input
+                id="name"
+                name="name"
+                type="text"
+                placeholder="Aarav Sharma"
+                autoComplete="name"
+                required
+                value={formData.name}
+                onChange={(e) => handleChange('name', e.target.value)}
+                className="auth-input w-full px-4 py-3 rounded-lg focus:outline-none"
+              />
+            </div>
+
+            <div className="grid gap-3">
+              <label htmlFor="email" className="auth-label">
+                Email Address
+              </label>
+              <input
+                id="email"
+                name="email"
+                type="email"
+                placeholder="you@airaware.gov.in"
+                autoComplete="email"
+                required
+                value={formData.email}
+                onChange={(e) => handleChange('email', e.target.value)}
+                className="auth-input w-full px-4 py-3 rounded-lg focus:outline-none"
+              />
+            </div>
+
+            <div className="grid gap-3">
+              <label htmlFor="password" className="auth-label">
+                Password
+              </label>
+              <input
+                id="password"
+                name="password"
+                type="password"
+                placeholder="••••••••"
+                autoComplete="new-password"
+                required
+                minLength={8}
+                value={formData.password}
+                onChange={(e) => handleChange('password', e.target.value)}
+                className="auth-input w-full px-4 py-3 rounded-lg focus:outline-none"
+              />
+            </div>
+
+            <div className="grid gap-3">
+              <label htmlFor="confirmPassword" className="auth-label">
+                Confirm Password
+              </label>
+              <input
+                id="confirmPassword"
+                name="confirmPassword"
+                type="password"
+                placeholder="••••••••"
+                autoComplete="new-password"
+                required
+                minLength={8}
+                value={formData.confirmPassword}
+                onChange={(e) => handleChange('confirmPassword', e.target.value)}
+                className="auth-input w-full px-4 py-3 rounded-lg focus:outline-none"
+              />
+            </div>
+
+            <button
+              type="submit"
+              disabled={isLoading}
+              className="auth-button w-full py-3 px-4 rounded-lg font-medium"
+            >
+              {isLoading ? (
+                <>
+                  <span className="auth-loading"></span>
+                  Creating account...
+                </>
+              ) : (
+                'Create account'
+              )}
+            </button>
+
+            <p className="text-center text-sm auth-footer-text">
+              Already have an account?{' '}
+              <button
+                type="button"
+                onClick={() => {
+                  onClose();
+                  window.showLoginPage();
+                }}
+                className="auth-link"
+              >
+                Sign in
+              </button>
+              .
+            </p>
+          </form>
+        </div>
+
+        <div className="mt-8 text-center auth-footer-text">
+          By creating an account, you agree to our{' '}
+          <button className="auth-link">
+            Terms of Service
+          </button>{' '}
+          and{' '}
+          <button className="auth-link">
+            Privacy Policy
+          </button>
+          .
+        </div>
+      </div>
+    </main>
+  );
+};
+
+// Global functions to show/hide signup page
+window.showSignupPage = () => {
+  const overlay = document.getElementById('signup-overlay');
+  const content = document.getElementById('signup-content');
+  
+  overlay.classList.add('show');
+  
+  const signupPageElement = React.createElement(SignupPage, {
+    onClose: window.hideSignupPage
+  });
+  
+  ReactDOM.render(signupPageElement, content);
+};
+
+window.hideSignupPage = () => {
+  const overlay = document.getElementById('signup-overlay');
+  const content = document.getElementById('signup-content');
+  
+  overlay.classList.remove('show');
+  if (content && ReactDOM.unmountComponentAtNode) {
+    ReactDOM.unmountComponentAtNode(content);
+  }
+};
+
+// Close signup page when clicking outside (on overlay background)
+document.getElementById('signup-overlay').addEventListener('click', (e) => {
+  if (e.target.id === 'signup-overlay') {
+    window.hideSignupPage();
+  }
+});
+
+// Specific Login Page Component (from authentication folder)
+const LoginPage = ({ onClose }) => {
+  const [email, setEmail] = useState('');
+  const [password, setPassword] = useState('');
+  const [isLoading, setIsLoading] = useState(false);
+
+  const handleSubmit = async (e) => {
+    e.preventDefault();
+    
+    if (!email || !password) {
+      alert('Please fill in both fields');
+      return;
+    }
+    
+    if (!email.includes('@')) {
+      alert('Please enter a valid email address');
+      return;
+    }
+    
+    setIsLoading(true);
+    
+    try {
+      // Get CSRF token
+      const csrftoken = getCookie('csrftoken');
+      
+      // Call Django backend API
+      const response = await fetch('/api/auth/login/', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'X-CSRFToken': csrftoken,
+        },
+        credentials: 'same-origin',
+        body: JSON.stringify({
+          email: email,
+          password: password,
+        }),
+      });
+
+      const data = await response.json();
+
+      if (!response.ok) {
+        alert(data.error || 'Login failed. Please try again.');
+        setIsLoading(false);
+        return;
+      }
+
+      // Success! Store user data and redirect to dashboard
+      if (data.success) {
+        localStorage.setItem('user', JSON.stringify(data.user));
+        alert('Successfully signed in! Welcome back!');
+        window.location.href = data.redirect_url || '/dashboard/';
+      } else {
+        alert('Login successful!');
+        onClose();
+      }
+    } catch (error) {
+      console.error('Login error:', error);
+      alert('Network error. Please make sure the server is running.');
+      setIsLoading(false);
+    }
+  };
+
+  return (
+    <main className="min-h-dvh flex items-center justify-center px-4 py-10">
+      <div className="signup-container">
+        {/* Close button */}
+        <div className="flex justify-end mb-6">
+          <button
+            onClick={onClose}
+            className="auth-close-btn"
+          >
+            ×
+          </button>
+        </div>
+        
+        <div className="mb-8 space-y-4 text-center">
+          <span className="auth-badge">
+            AI-Powered Environmental Intelligence
+          </span>
+          <h1 className="auth-title">
+            Breathe easy. Sign in
+          </h1>
+          <p className="auth-subtitle">
+            Access live air quality insights, policy analytics, and personalized health recommendations.
+          </p>
+        </div>
+
+        <div className="auth-form-container p-8">
+          <form className="grid gap-6" onSubmit={handleSubmit}>
+            <div className="grid gap-3">
+              <label htmlFor="email" className="auth-label">
+                Email Address
+              </label>
+              <input
+                id="email"
+                name="email"
+                type="email"
+                placeholder="you@airaware.gov.in"
+                autoComplete="email"
+                required
+                value={email}
+                onChange={(e) => setEmail(e.target.value)}
+                className="auth-input w-full px-4 py-3 rounded-lg focus:outline-none"
+              />
+            </div>
+
+            <div className="grid gap-3">
+              <div className="flex items-center justify-between">
+                <label htmlFor="password" className="auth-label">
+                  Password
+                </label>
+                <button
+                  type="button"
+                  className="auth-link text-xs"
+                >
+                  Forgot password?
+                </button>
+              </div>
+              <input
+                id="password"
+                name="password"
+                type="password"
+                placeholder="••••••••"
+                autoComplete="current-password"
+                required
+                minLength={8}
+                value={password}
+                onChange={(e) => setPassword(e.target.value)}
+                className="auth-input w-full px-4 py-3 rounded-lg focus:outline-none"
+              />
+            </div>
+
+            <button
+              type="submit"
+              disabled={isLoading}
+              className="auth-button w-full py-3 px-4 rounded-lg font-medium"
+            >
+              {isLoading ? (
+                <>
+                  <span className="auth-loading"></span>
+                  Signing in...
+                </>
+              ) : (
+                'Sign in'
+              )}
+            </button>
+
+            <p className="text-center text-sm auth-footer-text">
+              Don't have an account?{' '}
+              <button
+                type="button"
+                onClick={() => {
+                  onClose();
+                  window.showSignupPage();
+                }}
+                className="auth-link"
+              >
+                Create one
+              </button>
+              .
+            </p>
+          </form>
+        </div>
+
+        <div className="mt-8 text-center auth-footer-text">
+          By continuing, you agree to our{' '}
+          <button className="auth-link">
+            Terms of Service
+          </button>{' '}
+          and{' '}
+          <button className="auth-link">
+            Privacy Policy
+          </button>
+          .
+        </div>
+      </div>
+    </main>
+  );
+};
+
+// Navigation functions are defined earlier in the script
+// (showLoginPage, showSignupPage, hideSignupPage)
@@ -0,0 +1,385 @@
+        lucide.createIcons();
+        
+        // Pricing billing toggle functionality
+        document.addEventListener('DOMContentLoaded', function() {
+            const billingToggles = document.querySelectorAll('.billing-toggle');
+            
+            billingToggles.forEach(toggle => {
+                toggle.addEventListener('click', function() {
+                    const period = this.getAttribute('data-period');
+                    
+                    // Update toggle states
+                    billingToggles.forEach(t => {
+                        t.classList.remove('bg-blue-500', 'shadow-lg', 'text-white');
+                        t.classList.add('text-slate-400', 'hover:text-white');
+                    });
+                    
+                    this.classList.add('bg-blue-500', 'shadow-lg', 'text-white');
+                    this.classList.remove('text-slate-400', 'hover:text-white');
+                    
+                    // Here you could update pricing display based on period
+                    // For now, we'll just show the toggle working
+                });
+            });
+        });
+
+        // Sticky scroll animation for How It Works section
+        document.addEventListener('DOMContentLoaded', function() {
+            const steps = document.querySelectorAll('.space-y-24 > div');
+            const rightPanel = document.querySelector('.lg\\:sticky');
+            
+            // Create intersection observer
+            const observer = new IntersectionObserver((entries) => {
+                entries.forEach(entry => {
+                    if (entry.isIntersecting) {
+                        const stepIndex = Array.from(steps).indexOf(entry.target);
+                        
+                        // Add active state to current step
+                        steps.forEach((step, index) => {
+                            if (index === stepIndex) {
+                                step.classList.add('scale-105');
+                                step.classList.remove('opacity-70');
+                            } else {
+                                step.classList.remove('scale-105');
+                                step.classList.add('opacity-70');
+                            }
+                        });
+                        
+                        // Update right panel based on active step
+                        if (rightPanel) {
+                            const panelContent = rightPanel.querySelector('.bg-black\\/40');
+                            if (panelContent) {
+                                // Add subtle animation based on step
+                                panelContent.style.transform = `translateY(${stepIndex * -3}px) rotateY(${stepIndex * 0.5}deg)`;
+                                panelContent.style.transition = 'transform 0.6s ease-out';
+                                
+                                // Change glow color based on step
+                                const glowElement = rightPanel.querySelector('.blur-sm');
+                                if (glowElement) {
+                                    const colors = [
+                                        'radial-gradient(60% 50% at 70% 30%, rgba(45,212,191,0.15), transparent 60%)', // teal
+                                        'radial-gradient(60% 50% at 70% 30%, rgba(147,51,234,0.15), transparent 60%)', // purple  
+                                        'radial-gradient(60% 50% at 70% 30%, rgba(16,185,129,0.15), transparent 60%)'  // emerald
+                                    ];
+                                    glowElement.style.background = colors[stepIndex] || colors[0];
+                                    glowElement.style.transition = 'background 0.6s ease-out';
+                                }
+                            }
+                        }
+                    }
+                });
+            }, {
+                threshold: 0.6,
+                rootMargin: '-10% 0px -30% 0px'
+            });
+            
+            // Observe all steps
+            steps.forEach(step => observer.observe(step));
+            
+            // Initial state - make first step active
+            if (steps.length > 0) {
+                steps[0].classList.add('scale-105');
+                for (let i = 1; i < steps.length; i++) {
+                    steps[i].classList.add('opacity-70');
+                }
+            }
+        });
+        
+        // Mobile Menu Toggle Function
+        document.addEventListener('DOMContentLoaded', function() {
+            const mobileMenuBtn = document.getElementById('mobile-menu-btn');
+            const mobileMenu = document.getElementById('mobile-menu');
+            let isMenuOpen = false;
+
+            if (mobileMenuBtn && mobileMenu) {
+                mobileMenuBtn.addEventListener('click', function() {
+                    isMenuOpen = !isMenuOpen;
+                    
+                    if (isMenuOpen) {
+                        mobileMenu.classList.remove('hidden');
+                        mobileMenu.classList.add('animate-fade-in');
+                    } else {
+                        mobileMenu.classList.add('hidden');
+                        mobileMenu.classList.remove('animate-fade-in');
+                    }
+                });
+
+                // Close menu when clicking outside
+                document.addEventListener('click', function(event) {
+                    if (isMenuOpen && !mobileMenu.contains(event.target) && !mobileMenuBtn.contains(event.target)) {
+                        isMenuOpen = false;
+                        mobileMenu.classList.add('hidden');
+                        mobileMenu.classList.remove('animate-fade-in');
+                    }
+                });
+
+                // Close menu when clicking on menu links
+                mobileMenu.addEventListener('click', function(event) {
+                    if (event.target.tagName === 'A') {
+                        isMenuOpen = false;
+                        mobileMenu.classList.add('hidden');
+                        mobileMenu.classList.remove('animate-fade-in');
+                    }
+                });
+            }
+        });
+        
+        // Enhanced Mobile Dropdown Menu Toggle
+        document.addEventListener('DOMContentLoaded', function() {
+            const mobileMenuBtn = document.getElementById('mobile-menu-btn');
+            const mobileMenu = document.getElementById('mobile-menu');
+            let isMenuOpen = false;
+
+            function openMobileMenu() {
+                isMenuOpen = true;
+                mobileMenu.classList.remove('invisible', 'opacity-0', 'scale-95');
+                mobileMenu.classList.add('opacity-100', 'scale-100');
+                
+                // Animate hamburger to X
+                const lines = mobileMenuBtn.querySelectorAll('.hamburger-line');
+                lines[0].style.transform = 'rotate(45deg) translate(3px, 3px)';
+                lines[1].style.opacity = '0';
+                lines[2].style.transform = 'rotate(-45deg) translate(3px, -3px)';
+                
+                // Prevent body scroll
+                document.body.style.overflow = 'hidden';
+            }
+
+            function closeMobileMenu() {
+                isMenuOpen = false;
+                mobileMenu.classList.remove('opacity-100', 'scale-100');
+                mobileMenu.classList.add('invisible', 'opacity-0', 'scale-95');
+                
+                // Reset hamburger animation
+                const lines = mobileMenuBtn.querySelectorAll('.hamburger-line');
+                lines[0].style.transform = 'rotate(0) translate(0, 0)';
+                lines[1].style.opacity = '1';
+                lines[2].style.transform = 'rotate(0) translate(0, 0)';
+                
+                // Restore body scroll
+                document.body.style.overflow = 'auto';
+            }
+
+            if (mobileMenuBtn && mobileMenu) {
+                // Toggle menu on button click
+                mobileMenuBtn.addEventListener('click', function(e) {
+                    e.stopPropagation();
+                    if (isMenuOpen) {
+                        closeMobileMenu();
+                    } else {
+                        openMobileMenu();
+                    }
+                });
+
+                // Close menu when clicking outside
+                document.addEventListener('click', function(event) {
+                    if (isMenuOpen && !mobileMenu.contains(event.target) && !mobileMenuBtn.contains(event.target)) {
+                        closeMobileMenu();
+                    }
+                });
+
+                // Close menu when clicking on menu links
+                mobileMenu.addEventListener('click', function(event) {
+                    if (event.target.tagName === 'A' || event.target.closest('a')) {
+                        closeMobileMenu();
+                    }
+                });
+
+                // Close menu on escape key
+                document.addEventListener('keydown', function(event) {
+                    if (event.key === 'Escape' && isMenuOpen) {
+                        closeMobileMenu();
+                    }
+                });
+
+                // Close menu on window resize to desktop
+                window.addEventListener('resize', function() {
+                    if (window.innerWidth >= 1024 && isMenuOpen) {
+                        closeMobileMenu();
+                    }
+                });
+            }
+        });
+        
+        // FAQ Toggle Function
+        function toggleFAQ(id) {
+            const content = document.getElementById(`content-${id}`);
+            const icon = document.getElementById(`icon-${id}`);
+            
+            if (content.classList.contains('hidden')) {
+                content.classList.remove('hidden');
+                icon.style.transform = 'rotate(45deg)';
+            } else {
+                content.classList.add('hidden');
+                icon.style.transform = 'rotate(0deg)';
+            }
+        }
+        
+        // Typing animation for chat
+        (function() {
+            const responses = [
+                "Excellent! Monitoring Delhi-NCR air quality with real-time data:",
+                "Perfect! Building cleaner cities through advanced analytics:",
+                "Great! Protecting public health with AI-powered insights:",
+                "Amazing! Creating sustainable environments with smart monitoring:"
+            ];
+            
+            let currentResponseIndex = 0;
+            const responseElement = document.getElementById('aiResponse');
+            const statusElement = document.getElementById('typingStatus');
+
+            function typeResponse(text, callback) {
+                if (!responseElement) return;
+                responseElement.innerHTML = '';
+                let i = 0;
+                
+                function type() {
+                    if (i < text.length) {
+                        responseElement.innerHTML = text.substring(0, i + 1);
+                        i++;
+                        const delay = 40 + Math.random() * 30;
+                        setTimeout(type, delay);
+                    } else {
+                        if (statusElement) {
+                            setTimeout(() => {
+                                statusElement.textContent = 'Analysis complete';
+                                setTimeout(callback, 2000);
+                            }, 1000);
+                        }
+                    }
+                }
+                
+                if (statusElement) statusElement.textContent = 'Analyzing air quality data...';
+                setTimeout(type, 800);
+            }
+
+            function startNextResponse() {
+                typeResponse(responses[currentResponseIndex], () => {
+                    currentResponseIndex = (currentResponseIndex + 1) % responses.length;
+                    setTimeout(startNextResponse, 1500);
+                });
+            }
+
+            // Start the loop
+            setTimeout(startNextResponse, 2000);
+        })();
+        
+        // EmailJS Configuration and Contact Form Handler
+        (function() {
+            // EmailJS Configuration
+            const EMAILJS_CONFIG = {
+                PUBLIC_KEY: 'crHauJ88UDzOS4puy',
+                SERVICE_ID: 'service_e3rc8vk', // Your actual service ID
+                TEMPLATE_ID: 'template_sxw9783'
+            };
+            
+            // Initialize EmailJS with your public key
+            emailjs.init(EMAILJS_CONFIG.PUBLIC_KEY);
+            
+            const form = document.getElementById('contact-form');
+            const submitButton = document.getElementById('submit-button');
+            const buttonContent = document.getElementById('button-content');
+            const successMessage = document.getElementById('success-message');
+            const errorMessage = document.getElementById('error-message');
+            
+            // Form submission handler
+            form.addEventListener('submit', function(e) {
+                e.preventDefault();
+                
+                // Show loading state
+                submitButton.disabled = true;
+                buttonContent.innerHTML = `
+                    <svg class="animate-spin h-5 w-5 text-white" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24">
+                        <circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle>
+                        <path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path>
+                    </svg>
+                    Sending Message...
+                `;
+                
+                // Hide previous messages
+                successMessage.classList.add('hidden');
+                errorMessage.classList.add('hidden');
+                
+                // Get form data
+                const formData = new FormData(form);
+                const templateParams = {
+                    from_name: formData.get('name') || 'Anonymous',
+                    from_email: formData.get('email') || 'no-email@example.com',
+                    organization: formData.get('organization') || 'Not specified',
+                    user_type: formData.get('userType') || 'Not specified',
+                    subject: formData.get('subject') || 'No subject',
+                    message: formData.get('message') || 'No message',
+                    to_name: 'AirAware Team',
+                    reply_to: formData.get('email') || 'no-email@example.com'
+                };
+                
+                // Debug logging
+                console.log('Sending email with config:', EMAILJS_CONFIG);
+                console.log('Template parameters:', templateParams);
+                
+                // Send email using EmailJS
+                emailjs.send(
+                    EMAILJS_CONFIG.SERVICE_ID, // Your EmailJS service ID
+                    EMAILJS_CONFIG.TEMPLATE_ID, // Your EmailJS template ID
+                    templateParams
+                ).then(function(response) {
+                    // Success
+                    console.log('Email sent successfully:', response);
+                    
+                    // Show success message
+                    successMessage.classList.remove('hidden');
+                    successMessage.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                    
+                    // Reset form
+                    form.reset();
+                    
+                    // Reset button
+                    resetButton();
+                    
+                }, function(error) {
+                    // Enhanced error logging
+                    console.error('Email send failed:', error);
+                    console.error('Error details:', {
+                        status: error.status,
+                        text: error.text,
+                        config: EMAILJS_CONFIG
+                    });
+                    
+                    // Update error message with more details
+                    const errorDetail = document.querySelector('#error-message p');
+                    if (errorDetail) {
+                        if (error.status === 400) {
+                            errorDetail.textContent = 'Configuration error. Please check EmailJS template settings or contact support.';
+                        } else if (error.status === 403) {
+                            errorDetail.textContent = 'Authentication error. Please check your EmailJS public key.';
+                        } else {
+                            errorDetail.textContent = `Error ${error.status}: ${error.text || 'Please try again or contact us directly.'}`; 
+                        }
+                    }
+                    
+                    // Show error message
+                    errorMessage.classList.remove('hidden');
+                    errorMessage.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                    
+                    // Reset button
+                    resetButton();
+                });
+            });
+            
+            function resetButton() {
+                submitButton.disabled = false;
+                buttonContent.innerHTML = `
+                    <svg xmlns="http://www.w3.org/2000/svg" width="22" height="22" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+                        <path d="M14.536 21.686a.5.5 0 0 0 .937-.024l6.5-19a.496.496 0 0 0-.635-.635l-19 6.5a.5.5 0 0 0-.024.937l7.93 3.18a2 2 0 0 1 1.112 1.11z"></path>
+                        <path d="m21.854 2.147-10.94 10.939"></path>
+                    </svg>
+                    Send Message & Get Started
+                    <svg xmlns="http://www.w3.org/2000/svg" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="animate-pulse">
+                        <polyline points="9,18 15,12 9,6"></polyline>
+                    </svg>
+                `;
+            }
+        })();
+
+
+    
@@ -0,0 +1,60 @@
+    // Billing toggle functionality for pricing section
+    (function() {
+      const toggles = document.querySelectorAll('.billing-toggle');
+      const businessPrice = document.querySelector('[data-price="business"]');
+      const governmentPrice = document.querySelector('[data-price="government"]');
+      
+      const prices = {
+        monthly: {
+          business: '₹14,999',
+          government: 'Custom'
+        },
+        annual: {
+          business: '₹12,999',
+          government: 'Custom'
+        }
+      };
+
+      function setPlan(period) {
+        // Update toggle states
+        toggles.forEach(toggle => {
+          if (toggle.getAttribute('data-period') === period) {
+            toggle.classList.add('text-white', 'bg-blue-500', 'shadow-lg');
+            toggle.classList.remove('text-slate-400', 'hover:text-white');
+          } else {
+            toggle.classList.remove('text-white', 'bg-blue-500', 'shadow-lg');
+            toggle.classList.add('text-slate-400', 'hover:text-white');
+          }
+        });
+
+        // Update prices with animation
+        if (businessPrice) {
+          businessPrice.style.transform = 'scale(0.8)';
+          businessPrice.style.opacity = '0.5';
+          setTimeout(() => {
+            businessPrice.textContent = prices[period].business;
+            businessPrice.style.transform = 'scale(1)';
+            businessPrice.style.opacity = '1';
+          }, 150);
+        }
+        
+        if (governmentPrice) {
+          governmentPrice.style.transform = 'scale(0.8)';
+          governmentPrice.style.opacity = '0.5';
+          setTimeout(() => {
+            governmentPrice.textContent = prices[period].government;
+            governmentPrice.style.transform = 'scale(1)';
+            governmentPrice.style.opacity = '1';
+          }, 150);
+        }
+      }
+
+      // Set default to annual
+      setPlan('annual');
+
+      // Handlers
+      toggles.forEach(btn => {
+        btn.addEventListener('click', () => setPlan(btn.getAttribute('data-period')));
+      });
+    })();
+    
@@ -0,0 +1,51 @@
+    (function() {
+      const root = document.currentScript.closest('section[data-element-id="aura-emfzp9hq8"]');
+      if (!root) return;
+
+      const toggle = root.querySelector('#billingToggle');
+      const thumb = root.querySelector('#toggleThumb');
+      const buttons = toggle.querySelectorAll('button[data-plan]');
+      const saveBadge = root.querySelector('#saveBadge');
+      const priceEls = root.querySelectorAll('[data-price]');
+      const termEls = root.querySelectorAll('[data-term]');
+      const noteEls = root.querySelectorAll('[data-billing-note]');
+
+      function setPlan(plan) {
+        // Update pressed state and styles
+        buttons.forEach(btn => {
+          const active = btn.getAttribute('data-plan') === plan;
+          btn.setAttribute('aria-pressed', active ? 'true' : 'false');
+          btn.classList.toggle('text-slate-900', active);
+          btn.classList.toggle('text-slate-300', !active);
+        });
+
+        // Move thumb
+        if (plan === 'monthly') {
+          thumb.style.left = 'calc(50% - 92px + 1px)'; // right segment
+        } else {
+          thumb.style.left = '4px'; // left segment
+        }
+
+        // Update prices and labels
+        priceEls.forEach(el => {
+          const monthly = el.getAttribute('data-monthly');
+          const annual = el.getAttribute('data-annual');
+          const value = plan === 'annual' ? annual : monthly;
+          el.textContent = `$${value}`;
+        });
+        termEls.forEach(el => el.textContent = plan === 'annual' ? '/year' : '/month');
+        noteEls.forEach(el => el.textContent = plan === 'annual' ? 'Billed annually' : 'Pay monthly');
+
+        // Save badge visibility
+        if (saveBadge) saveBadge.classList.toggle('hidden', plan !== 'annual');
+      }
+
+      // Initialize
+      setPlan('monthly');
+
+      // Handlers
+      buttons.forEach(btn => {
+        btn.addEventListener('click', () => setPlan(btn.getAttribute('data-plan')));
+      });
+    })();
+  
@@ -0,0 +1,156 @@
+        // CSRF Token Helper
+        function getCookie(name) {
+            let cookieValue = null;
+            if (document.cookie && document.cookie !== '') {
+                const cookies = document.cookie.split(';');
+                for (let i = 0; i < cookies.length; i++) {
+                    const cookie = cookies[i].trim();
+                    if (cookie.substring(0, name.length + 1) === (name + '=')) {
+                        cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                        break;
+                    }
+                }
+            }
+            return cookieValue;
+        }
+
+        // Test Register
+        async function testRegister() {
+            const resultEl = document.getElementById('register-result');
+            resultEl.textContent = 'Testing...';
+            
+            try {
+                const csrftoken = getCookie('csrftoken');
+                const testData = {
+                    username: `test${Date.now()}@example.com`,
+                    email: `test${Date.now()}@example.com`,
+                    password: 'testpassword123',
+                    confirm_password: 'testpassword123',
+                    first_name: 'Test',
+                    last_name: 'User'
+                };
+
+                const response = await fetch('/api/auth/register/', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                        'X-CSRFToken': csrftoken,
+                    },
+                    credentials: 'same-origin',
+                    body: JSON.stringify(testData)
+                });
+
+                const data = await response.json();
+                
+                resultEl.textContent = `Status: ${response.status}\n\n` + 
+                    JSON.stringify(data, null, 2);
+                resultEl.className = response.ok ? 
+                    'mt-4 bg-green-900/50 p-4 rounded text-sm overflow-auto' : 
+                    'mt-4 bg-red-900/50 p-4 rounded text-sm overflow-auto';
+            } catch (error) {
+                resultEl.textContent = `Error: ${error.message}`;
+                resultEl.className = 'mt-4 bg-red-900/50 p-4 rounded text-sm overflow-auto';
+            }
+        }
+
+        // Test Login
+        async function testLogin() {
+            const resultEl = document.getElementById('login-result');
+            resultEl.textContent = 'Testing...';
+            
+            try {
+                const csrftoken = getCookie('csrftoken');
+                const testData = {
+                    email: 'test@example.com',
+                    password: 'testpassword123'
+                };
+
+                const response = await fetch('/api/auth/login/', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                        'X-CSRFToken': csrftoken,
+                    },
+                    credentials: 'same-origin',
+                    body: JSON.stringify(testData)
+                });
+
+                const data = await response.json();
+                
+                resultEl.textContent = `Status: ${response.status}\n\n` + 
+                    JSON.stringify(data, null, 2);
+                resultEl.className = response.ok ? 
+                    'mt-4 bg-green-900/50 p-4 rounded text-sm overflow-auto' : 
+                    'mt-4 bg-red-900/50 p-4 rounded text-sm overflow-auto';
+            } catch (error) {
+                resultEl.textContent = `Error: ${error.message}`;
+                resultEl.className = 'mt-4 bg-red-900/50 p-4 rounded text-sm overflow-auto';
+            }
+        }
+
+        // Test Check Auth
+        async function testCheckAuth() {
+            const resultEl = document.getElementById('check-result');
+            resultEl.textContent = 'Testing...';
+            
+            try {
+                const response = await fetch('/api/auth/check/', {
+                    method: 'GET',
+                    credentials: 'same-origin'
+                });
+
+                const data = await response.json();
+                
+                resultEl.textContent = `Status: ${response.status}\n\n` + 
+                    JSON.stringify(data, null, 2);
+                resultEl.className = response.ok ? 
+                    'mt-4 bg-green-900/50 p-4 rounded text-sm overflow-auto' : 
+                    'mt-4 bg-red-900/50 p-4 rounded text-sm overflow-auto';
+            } catch (error) {
+                resultEl.textContent = `Error: ${error.message}`;
+                resultEl.className = 'mt-4 bg-red-900/50 p-4 rounded text-sm overflow-auto';
+            }
+        }
+
+        // Test Logout
+        async function testLogout() {
+            const resultEl = document.getElementById('logout-result');
+            resultEl.textContent = 'Testing...';
+            
+            try {
+                const csrftoken = getCookie('csrftoken');
+
+                const response = await fetch('/api/auth/logout/', {
+                    method: 'POST',
+                    headers: {
+                        'X-CSRFToken': csrftoken,
+                    },
+                    credentials: 'same-origin'
+                });
+
+                const data = await response.json();
+                
+                resultEl.textContent = `Status: ${response.status}\n\n` + 
+                    JSON.stringify(data, null, 2);
+                resultEl.className = response.ok ? 
+                    'mt-4 bg-green-900/50 p-4 rounded text-sm overflow-auto' : 
+                    'mt-4 bg-red-900/50 p-4 rounded text-sm overflow-auto';
+            } catch (error) {
+                resultEl.textContent = `Error: ${error.message}`;
+                resultEl.className = 'mt-4 bg-red-900/50 p-4 rounded text-sm overflow-auto';
+            }
+        }
+
+        // Run All Tests
+        async function runAllTests() {
+            console.log('Running all tests...');
+            await testRegister();
+            await new Promise(resolve => setTimeout(resolve, 1000));
+            await testCheckAuth();
+            await new Promise(resolve => setTimeout(resolve, 1000));
+            await testLogout();
+            await new Promise(resolve => setTimeout(resolve, 1000));
+            await testLogin();
+            console.log('All tests completed!');
+        }
+    
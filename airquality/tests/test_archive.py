@@ -0,0 +1,79 @@
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+
+from django.test import TestCase
+
+from airquality.archive import archive_readings, partition_path
+from airquality.models import AirQualityReading
+from airquality.trends import aggregate_readings, load_readings
+
+
+def make_reading(location, timestamp, aqi, pm25):
+    return AirQualityReading(location=location, timestamp=timestamp, aqi_value=aqi,
+                             pm25=pm25, pm10=pm25 * 1.5)
+
+
+class ArchiveRoundTripTests(TestCase):
+    def setUp(self):
+        self.root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.start = datetime(2024, 1, 30, tzinfo=dt_timezone.utc)
+        # Four days spanning a month boundary, hourly, for two locations
+        AirQualityReading.objects.bulk_create([
+            make_reading(location, self.start + timedelta(hours=hour), 50 + hour % 40, 10.0 + hour)
+            for location in ('Delhi', 'Mumbai')
+            for hour in range(96)
+        ])
+        self.end = self.start + timedelta(days=4)
+        self.cutoff = self.start + timedelta(days=2, hours=12)
+
+    def aggregates(self, **kwargs):
+        return aggregate_readings(start=self.start, end=self.end, fields=['aqi_value', 'pm25'],
+                                  root=self.root, **kwargs)
+
+    def test_archive_then_trends_returns_same_aggregates(self):
+        expected = self.aggregates(location='Delhi')
+        expected_all = self.aggregates(interval='hour')
+
+        stats = archive_readings(cutoff=self.cutoff, root=self.root)
+
+        self.assertEqual(stats['rows'], 2 * 60)
+        self.assertIn(partition_path('Delhi', '2024-01', self.root), stats['files'])
+        self.assertIn(partition_path('Mumbai', '2024-02', self.root), stats['files'])
+        self.assertFalse(AirQualityReading.objects.filter(timestamp__lt=self.cutoff).exists())
+        self.assertEqual(self.aggregates(location='Delhi'), expected)
+        self.assertEqual(self.aggregates(interval='hour'), expected_all)
+
+    def test_dry_run_keeps_database_rows(self):
+        stats = archive_readings(cutoff=self.cutoff, root=self.root, dry_run=True)
+
+        self.assertEqual(stats['rows'], 2 * 60)
+        self.assertEqual(AirQualityReading.objects.count(), 2 * 96)
+        self.assertEqual(list(self.root.iterdir()), [])
+
+    def test_rerun_does_not_duplicate_archived_rows(self):
+        archive_readings(cutoff=self.cutoff, root=self.root, batch_size=25)
+        archive_readings(cutoff=self.cutoff, root=self.root)
+
+        frame = load_readings(location='Mumbai', start=self.start, end=self.end, root=self.root)
+        self.assertEqual(len(frame), 96)
+        self.assertTrue(frame['timestamp'].is_monotonic_increasing)
+
+    def test_non_ascii_locations_get_their_own_partitions(self):
+        AirQualityReading.objects.bulk_create([
+            make_reading(location, self.start + timedelta(hours=hour), 100 + offset, 20.0)
+            for offset, location in enumerate(('北京', 'दिल्ली', '!!!'))
+            for hour in range(24)
+        ])
+
+        stats = archive_readings(cutoff=self.cutoff, root=self.root)
+
+        paths = {partition_path(location, '2024-01', self.root) for location in ('北京', 'दिल्ली', '!!!')}
+        self.assertEqual(len(paths), 3)
+        self.assertTrue(paths <= set(stats['files']))
+        self.assertTrue(all(path.parent != self.root for path in paths))
+        for offset, location in enumerate(('北京', 'दिल्ली', '!!!')):
+            frame = load_readings(location=location, root=self.root)
+            self.assertEqual(len(frame), 24, location)
+            self.assertEqual(set(frame['aqi_value']), {100 + offset})
+        self.assertEqual(len(load_readings(start=self.start, end=self.end, root=self.root)), 2 * 96 + 3 * 24)
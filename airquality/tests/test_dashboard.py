@@ -0,0 +1,140 @@
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from airquality import dashboard
+from airquality.ingest import ingest_readings
+from airquality.models import AirQualityReading, SavedLocation, UserProfile
+from airquality.quality import QualityPipeline
+
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+# Pages render without a collectstatic manifest
+PLAIN_STATIC = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+@override_settings(CACHES=LOCMEM)
+class SnapshotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('asha', 'asha@example.com', 'password123')
+        UserProfile.objects.create(user=self.user, location='Delhi', health_conditions=['asthma'])
+        SavedLocation.objects.create(user=self.user, location='Mumbai')
+        self.now = timezone.now()
+        self.add_reading('Delhi', 120)
+
+    def add_reading(self, location, aqi):
+        self.now += timedelta(minutes=15)
+        AirQualityReading.objects.create(location=location, aqi_value=aqi, pm25=40.0, pm10=60.0,
+                                         timestamp=self.now)
+
+    def current(self, snapshot):
+        return {item['location']: item['aqi'] for item in snapshot['locations']}
+
+    def test_snapshot_contents(self):
+        snapshot = dashboard.get_snapshot(self.user)
+
+        self.assertEqual(self.current(snapshot), {'Delhi': 120, 'Mumbai': None})
+        # Sensitive users are alerted from 101
+        self.assertEqual([alert['location'] for alert in snapshot['alerts']], ['Delhi'])
+
+    def test_snapshot_is_served_from_cache(self):
+        dashboard.get_snapshot(self.user)
+        self.add_reading('Delhi', 60)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.current(dashboard.get_snapshot(self.user))['Delhi'], 120)
+
+    def test_ingest_invalidates_followers(self):
+        dashboard.get_snapshot(self.user)
+        with mock.patch('airquality.ingest.pipeline', QualityPipeline()):
+            ingest_readings([{'location': 'Mumbai', 'aqi_value': 75, 'pm25': 20, 'pm10': 35}])
+
+        self.assertEqual(self.current(dashboard.get_snapshot(self.user))['Mumbai'], 75)
+
+    def test_ingest_elsewhere_keeps_snapshot(self):
+        dashboard.get_snapshot(self.user)
+        with mock.patch('airquality.ingest.pipeline', QualityPipeline()), \
+                mock.patch('airquality.dashboard.build_snapshot') as build:
+            ingest_readings([{'location': 'Chennai', 'aqi_value': 75, 'pm25': 20, 'pm10': 35}])
+            dashboard.get_snapshot(self.user)
+
+        build.assert_not_called()
+
+    def test_invalidation_during_build_is_not_overwritten(self):
+        build_snapshot = dashboard.build_snapshot
+
+        def racing_build(user):
+            snapshot = build_snapshot(user)
+            self.add_reading('Delhi', 40)
+            dashboard.invalidate_locations(['Delhi'])
+            return snapshot
+
+        with mock.patch('airquality.dashboard.build_snapshot', racing_build):
+            self.assertEqual(self.current(dashboard.get_snapshot(self.user))['Delhi'], 120)
+
+        self.assertEqual(self.current(dashboard.get_snapshot(self.user))['Delhi'], 40)
+
+
+@override_settings(CACHES=LOCMEM, STORAGES=PLAIN_STATIC)
+class DashboardViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('ravi', 'ravi@example.com', 'password123')
+        self.client.force_login(self.user)
+
+    def test_dashboard_renders_snapshot_without_creating_profile(self):
+        UserProfile.objects.create(user=self.user, location='Pune')
+        AirQualityReading.objects.create(location='Pune', aqi_value=173, pm25=90.0, pm10=120.0,
+                                         timestamp=timezone.now())
+
+        response = self.client.get('/dashboard/')
+        self.assertContains(response, 'Current AQI - Pune')
+        self.assertContains(response, '>173<')
+
+        other = User.objects.create_user('meera', 'meera@example.com', 'password123')
+        self.client.force_login(other)
+        self.assertEqual(self.client.get('/dashboard/').status_code, 200)
+        self.assertFalse(UserProfile.objects.filter(user=other).exists())
+
+    def post_profile(self, payload):
+        return self.client.post('/api/auth/profile/', payload, content_type='application/json')
+
+    def test_null_location_clears_it(self):
+        self.post_profile({'location': 'Delhi'})
+        response = self.post_profile({'location': None})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['location'], '')
+        self.assertEqual(dashboard.get_snapshot(self.user)['locations'], [])
+
+    def test_invalid_locations_are_rejected(self):
+        for payload in ({'location': 'x' * 101}, {'location': 42}, {'location': ['Delhi']},
+                        {'saved_locations': ['y' * 101]}):
+            self.assertEqual(self.post_profile(payload).status_code, 400, payload)
+        self.assertFalse(UserProfile.objects.filter(user=self.user).exists())
+
+    def test_malformed_bodies_are_rejected(self):
+        for payload in ([], 'Delhi', None, {'health_conditions': [[1]]}, {'health_conditions': [{}]},
+                        {'health_conditions': 'asthma'}):
+            response = self.client.post('/api/auth/profile/', json.dumps(payload), content_type='application/json')
+            self.assertEqual(response.status_code, 400, payload)
+        self.assertFalse(UserProfile.objects.filter(user=self.user).exists())
+
+    def test_profile_update_invalidates_snapshot(self):
+        AirQualityReading.objects.create(location='Mumbai', aqi_value=88, pm25=30.0, pm10=50.0,
+                                         timestamp=timezone.now())
+        self.assertEqual(self.client.get('/api/dashboard/summary/').json()['locations'], [])
+
+        self.post_profile({'location': 'Mumbai', 'health_conditions': ['copd']})
+
+        summary = self.client.get('/api/dashboard/summary/').json()
+        self.assertEqual(summary['locations'][0]['aqi'], 88)
+        self.assertEqual(summary['health_conditions'], ['copd'])
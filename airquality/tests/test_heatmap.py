@@ -0,0 +1,129 @@
+import json
+import math
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from airquality import heatmap
+from airquality.ingest import ingest_readings
+from airquality.models import AirQualityReading, MonitoringStation
+from airquality.quality import QualityPipeline
+
+ZOOM = 8
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def tile_of(lat, lon, z=ZOOM):
+    n = 2 ** z
+    x = int((lon + 180.0) / 360.0 * n)
+    y = int((1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * n)
+    return x, y
+
+
+class StationFieldTests(TestCase):
+    def test_idw_matches_station_value_at_station(self):
+        station_field = heatmap.StationField([77.2, 77.3], [28.6, 28.7], [100, 200])
+        values = station_field.interpolate([77.2, 77.25, 80.0], [28.6, 28.65, 20.0])
+
+        self.assertAlmostEqual(values[0], 100, places=3)
+        self.assertAlmostEqual(values[1], 150, delta=1)
+        self.assertTrue(math.isnan(values[2]))
+
+
+@override_settings(CACHES=LOCMEM)
+class HeatmapTileTests(TestCase):
+    def setUp(self):
+        tmp = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(override_settings(AIRQUALITY_TILE_CACHE_DIR=tmp))
+        self.cache = self.enterContext(mock.patch.object(heatmap, 'tile_cache', heatmap.TileCache()))
+
+        self.station = MonitoringStation.objects.create(name='Delhi', latitude=28.6, longitude=77.2)
+        self.now = timezone.now()
+        self.add_reading('Delhi', 180)
+        self.x, self.y = tile_of(28.6, 77.2)
+
+    def add_reading(self, location, aqi, age=timedelta(minutes=5)):
+        AirQualityReading.objects.create(location=location, aqi_value=aqi, pm25=50.0, pm10=80.0,
+                                         timestamp=self.now - age)
+
+    def tile_url(self, fmt='json'):
+        return f'/api/heatmap/{ZOOM}/{self.x}/{self.y}.{fmt}'
+
+    def test_json_tile_has_station_value(self):
+        response = self.client.get(self.tile_url())
+
+        self.assertEqual(response.status_code, 200)
+        values = [v for v in json.loads(response.content)['values'] if v is not None]
+        self.assertTrue(values)
+        self.assertTrue(all(v == 180 for v in values))
+
+    def test_png_tile(self):
+        response = self.client.get(self.tile_url('png'))
+
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertTrue(response.content.startswith(b'\x89PNG'))
+
+    def test_matching_etag_skips_tile_lookup(self):
+        etag = self.client.get(self.tile_url())['ETag']
+
+        with mock.patch.object(self.cache, 'get') as get:
+            response = self.client.get(self.tile_url(), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        get.assert_not_called()
+
+    def test_version_ignores_readings_without_station(self):
+        version = heatmap.data_version(self.now)
+        self.add_reading('Somewhere else', 90)
+        self.assertEqual(heatmap.data_version(self.now), version)
+
+        self.add_reading('Delhi', 60, age=timedelta(minutes=1))
+        self.assertNotEqual(heatmap.data_version(self.now), version)
+
+    def test_version_changes_when_station_is_edited(self):
+        version = heatmap.data_version(self.now)
+        self.station.latitude = 28.7
+        self.station.save()
+
+        self.assertNotEqual(heatmap.data_version(self.now), version)
+
+    def test_readings_age_out_with_the_time_bucket(self):
+        later = self.now + timedelta(hours=heatmap.heatmap_setting('MAX_AGE_HOURS'), minutes=30)
+        version = heatmap.data_version(later)
+        self.assertNotEqual(version, heatmap.data_version(self.now))
+
+        with mock.patch('airquality.heatmap.timezone.now', return_value=later):
+            response = self.client.get(self.tile_url())
+        self.assertEqual(response['ETag'], f'"{version}"')
+        self.assertTrue(all(v is None for v in json.loads(response.content)['values']))
+
+    def test_tiles_are_cached_per_version(self):
+        render = mock.Mock(wraps=heatmap.render_json)
+        with mock.patch.dict(heatmap.RENDERERS, json=render):
+            first = self.client.get(self.tile_url()).content
+            self.assertEqual(self.client.get(self.tile_url()).content, first)
+            self.assertEqual(render.call_count, 1)
+
+            self.add_reading('Delhi', 20, age=timedelta(minutes=1))
+            self.client.get(self.tile_url())
+            self.assertEqual(render.call_count, 2)
+
+    def test_real_reading_over_gap_filler_changes_version(self):
+        timestamp = self.now - timedelta(minutes=1)
+        AirQualityReading.objects.create(location='Delhi', aqi_value=150, pm25=50.0, pm10=80.0,
+                                         timestamp=timestamp,
+                                         quality_flags=AirQualityReading.QUALITY_INTERPOLATED)
+        response = self.client.get(self.tile_url())
+        self.assertIn(150, json.loads(response.content)['values'])
+
+        with mock.patch('airquality.ingest.pipeline', QualityPipeline()):
+            ingest_readings([{'location': 'Delhi', 'aqi_value': 40, 'pm25': 10, 'pm10': 20,
+                              'timestamp': timestamp.isoformat()}])
+
+        self.assertEqual(AirQualityReading.objects.filter(timestamp=timestamp).count(), 1)
+        response = self.client.get(self.tile_url(), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+        values = {v for v in json.loads(response.content)['values'] if v is not None}
+        self.assertEqual(values, {40})
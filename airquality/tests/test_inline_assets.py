@@ -0,0 +1,97 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, override_settings
+
+from airquality.management.commands import extract_inline_assets
+
+SCRIPT = 'console.log("dashboard ready");\n' * 20
+STYLE = 'body { margin: 0; padding: 0; }\n' * 20
+
+PAGE = f"""<html><head>
+<style>{STYLE}</style>
+<style>.tiny {{ color: red; }}</style>
+</head><body>
+<script type="text/javascript">{SCRIPT}</script>
+<script type="text/babel">{SCRIPT}</script>
+<script>var user = "{{{{ user.username }}}}";{SCRIPT}</script>
+<script>{{% if debug %}}{SCRIPT}{{% endif %}}</script>
+</body></html>
+"""
+
+
+class ExtractInlineAssetsTests(SimpleTestCase):
+    def setUp(self):
+        root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.templates = root / 'templates'
+        self.static = root / 'static'
+        self.templates.mkdir()
+        self.enterContext(mock.patch.object(extract_inline_assets, 'TEMPLATE_DIR', self.templates))
+        self.enterContext(mock.patch.object(extract_inline_assets, 'STATIC_DIR', self.static))
+        self.template = self.templates / 'page.html'
+        self.template.write_text('﻿' + PAGE, encoding='utf-8')
+
+    def run_command(self, *args):
+        out = StringIO()
+        call_command('extract_inline_assets', *args, stdout=out)
+        return out.getvalue()
+
+    def assets(self):
+        return sorted(path.relative_to(self.static).as_posix() for path in self.static.rglob('*.*'))
+
+    def test_eligible_blocks_are_extracted(self):
+        self.assertIn('Extracted 2 inline block(s)', self.run_command())
+
+        assets = self.assets()
+        self.assertEqual(len(assets), 2)
+        css, js = assets
+        self.assertRegex(css, r'^airquality/inline/page-[0-9a-f]{10}\.css$')
+        self.assertEqual((self.static / js).read_text(encoding='utf-8'), SCRIPT)
+
+        rewritten = self.template.read_text(encoding='utf-8')
+        self.assertTrue(rewritten.startswith('﻿{% load static %}\n'))
+        self.assertIn(f'<link rel="stylesheet" href="{{% static \'{css}\' %}}">', rewritten)
+        self.assertIn(f'<script src="{{% static \'{js}\' %}}"></script>', rewritten)
+        self.assertNotIn(STYLE, rewritten)
+
+    def test_ineligible_blocks_stay_inline(self):
+        self.run_command()
+        rewritten = self.template.read_text(encoding='utf-8')
+
+        self.assertIn('<style>.tiny { color: red; }</style>', rewritten)
+        self.assertIn(f'<script type="text/babel">{SCRIPT}</script>', rewritten)
+        self.assertIn('{{ user.username }}', rewritten)
+        self.assertIn(f'{{% if debug %}}{SCRIPT}{{% endif %}}', rewritten)
+
+    def test_min_bytes(self):
+        self.run_command('--min-bytes', '10')
+        self.assertEqual(len(self.assets()), 3)
+
+    def test_second_run_is_a_no_op(self):
+        self.run_command()
+        rewritten = self.template.read_text(encoding='utf-8')
+
+        self.assertIn('Extracted 0 inline block(s)', self.run_command())
+        self.assertEqual(self.template.read_text(encoding='utf-8'), rewritten)
+        self.assertEqual(len(self.assets()), 2)
+
+    def test_check_fails_while_blocks_remain(self):
+        with self.assertRaises(CommandError):
+            self.run_command('--check')
+        self.assertEqual(self.template.read_text(encoding='utf-8'), '﻿' + PAGE)
+        self.assertEqual(self.assets(), [])
+
+        self.run_command()
+        self.assertIn('Found 0 inline block(s)', self.run_command('--check'))
+
+    def test_collectstatic_dry_run_writes_nothing(self):
+        static_root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        with override_settings(STATIC_ROOT=static_root):
+            call_command('collectstatic', dry_run=True, interactive=False, verbosity=0)
+
+        self.assertEqual(self.template.read_text(encoding='utf-8'), '﻿' + PAGE)
+        self.assertEqual(self.assets(), [])
+        self.assertEqual(list(static_root.iterdir()), [])
@@ -0,0 +1,74 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from airquality.ingest import ingest_readings
+from airquality.leaderboard import MemoryLeaderboard, category_bounds, get_leaderboard
+from airquality.models import AirQualityReading
+from airquality.quality import QualityPipeline
+
+
+@override_settings(AIRQUALITY_LEADERBOARD_REDIS_URL='')
+class RankingsTests(TestCase):
+    def setUp(self):
+        self.enterContext(mock.patch('airquality.leaderboard._board', None))
+        self.now = timezone.now()
+        for location, aqi in [('Delhi', 310), ('Mumbai', 140), ('Pune', 95), ('Kochi', 35), ('Agra', 180)]:
+            self.add_reading(location, aqi)
+        # An older, worse reading must not override Delhi's latest
+        self.add_reading('Delhi', 450, age=timedelta(hours=1))
+
+    def add_reading(self, location, aqi, age=timedelta(minutes=10)):
+        AirQualityReading.objects.create(location=location, aqi_value=aqi, pm25=10.0, pm10=20.0,
+                                         timestamp=self.now - age)
+
+    def rankings(self, **params):
+        response = self.client.get('/api/rankings/', params)
+        self.assertEqual(response.status_code, 200)
+        return [(entry['rank'], entry['location'], entry['aqi']) for entry in response.json()['rankings']]
+
+    def test_worst_and_best(self):
+        self.assertEqual(self.rankings(limit=3), [(1, 'Delhi', 310), (2, 'Agra', 180), (3, 'Mumbai', 140)])
+        self.assertEqual(self.rankings(order='best', limit=2), [(1, 'Kochi', 35), (2, 'Pune', 95)])
+
+    def test_category(self):
+        self.assertEqual(self.rankings(category='unhealthy-for-sensitive-groups'), [(1, 'Mumbai', 140)])
+        self.assertEqual(self.rankings(category='Good'), [(1, 'Kochi', 35)])
+        self.assertEqual(self.client.get('/api/rankings/', {'category': 'smoky'}).status_code, 400)
+
+    def test_category_bounds(self):
+        self.assertEqual(category_bounds('moderate'), (50, 100))
+        self.assertEqual(category_bounds('Hazardous'), (300, float('inf')))
+
+    def test_ingest_updates_rankings(self):
+        self.rankings()
+        with mock.patch('airquality.ingest.pipeline', QualityPipeline()):
+            ingest_readings([{'location': 'Kochi', 'aqi_value': 400, 'pm25': 10, 'pm10': 20}])
+
+        self.assertEqual(self.rankings(limit=1), [(1, 'Kochi', 400)])
+
+    def test_cities_that_stopped_reporting_are_not_ranked(self):
+        self.add_reading('Shimla', 20, age=timedelta(days=90))
+        self.assertNotIn('Shimla', [location for _, location, _ in self.rankings(order='best')])
+
+        # Entries already on the board drop out as they age
+        later = self.now + timedelta(hours=6, minutes=5)
+        get_leaderboard().update('Pune', 90, later)
+        with mock.patch('airquality.leaderboard.timezone.now', return_value=later):
+            self.assertEqual(self.rankings(), [(1, 'Pune', 90)])
+
+
+class MemoryLeaderboardTests(TestCase):
+    def test_older_update_is_ignored(self):
+        board = MemoryLeaderboard()
+        now = timezone.now()
+        board.update('Delhi', 200, now)
+        board.update('Delhi', 90, now - timedelta(minutes=30))
+        board.update('Mumbai', 120, now)
+
+        with mock.patch.object(board, '_ensure_loaded'):
+            self.assertEqual([(e['location'], e['aqi']) for e in board.top(5)], [('Delhi', 200), ('Mumbai', 120)])
+            self.assertEqual(board.in_range(100, 150, 5), [{'location': 'Mumbai', 'aqi': 120,
+                                                            'category': 'Unhealthy for Sensitive Groups'}])
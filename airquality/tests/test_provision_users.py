@@ -0,0 +1,123 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from airquality.models import UserProfile
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class ProvisionUsersTests(TestCase):
+    def setUp(self):
+        self.dir = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        User.objects.create_user('taken', 'taken@example.com', 'password123')
+
+    def run_command(self, name, content, **options):
+        path = self.dir / name
+        path.write_text(content, encoding='utf-8')
+        stdout, stderr = StringIO(), StringIO()
+        call_command('provision_users', str(path), workers=1, stdout=stdout, stderr=stderr, **options)
+        return stdout.getvalue(), stderr.getvalue().splitlines()
+
+    def test_csv_reports_errors_per_line(self):
+        out, errors = self.run_command('users.csv', '\n'.join([
+            'username,email,password,first_name,last_name,location',
+            'alice,alice@example.com,password123,Alice,Rao,Delhi',
+            'bob,bob@example.com,short,Bob,,',
+            'alice,alice2@example.com,password123,,,',
+            'taken,new@example.com,password123,,,',
+            'carol,taken@example.com,password123,,,',
+            'dave,,password123,,,',
+            'erin,erin@example.com,password123,Erin,,',
+        ]))
+
+        self.assertEqual(errors, [
+            'line 3: Password must be at least 8 characters long',
+            'line 4: Duplicate username in file: alice',
+            'line 5: Username already exists: taken',
+            'line 6: Email already exists: taken@example.com',
+            'line 7: Missing field(s): email',
+        ])
+        self.assertIn('Created 2 user(s)', out)
+        alice = User.objects.get(username='alice')
+        self.assertTrue(alice.check_password('password123'))
+        self.assertEqual(alice.profile.location, 'Delhi')
+        self.assertFalse(UserProfile.objects.filter(user__username='erin').exists())
+
+    def test_ndjson_rejects_wrong_types_and_lengths(self):
+        rows = [
+            {'username': 'frank', 'email': 'frank@example.com', 'password': 12345678},
+            {'username': 'g' * 151, 'email': 'g@example.com', 'password': 'password123'},
+            {'username': 'hana', 'email': 'hana@example.com', 'password': 'password123', 'location': 'x' * 101},
+            {'username': 'ivan', 'email': 'ivan@example.com', 'password': 'password123', 'last_name': ['I']},
+            {'username': 'jin', 'email': 'jin@example.com', 'password': 'password123'},
+        ]
+        content = '\n'.join(json.dumps(row) for row in rows) + '\nnot json\n'
+        out, errors = self.run_command('users.ndjson', content)
+
+        self.assertEqual(errors, [
+            'line 1: Field(s) must be text: password',
+            'line 2: username must be at most 150 characters',
+            'line 3: location must be at most 100 characters',
+            'line 4: Field(s) must be text: last_name',
+            'line 6: Invalid row',
+        ])
+        self.assertEqual(list(User.objects.exclude(username='taken').values_list('username', flat=True)), ['jin'])
+
+    def test_usernames_are_normalized_before_duplicate_checks(self):
+        User.objects.create_user('bob', 'Bob@example.com', 'password123')
+        out, errors = self.run_command('users.csv', '\n'.join([
+            'username,email,password',
+            '\uff42\uff4f\uff42,fullwidth@example.com,password123',
+            're\u0301a,rea@example.com,password123',
+            'r\u00e9a,rea2@example.com,password123',
+        ]))
+
+        self.assertEqual(errors, [
+            'line 2: Username already exists: bob',
+            'line 4: Duplicate username in file: r\u00e9a',
+        ])
+        self.assertTrue(User.objects.filter(username='r\u00e9a', email='rea@example.com').exists())
+
+    def test_email_domains_are_normalized_before_duplicate_checks(self):
+        User.objects.create_user('bob', 'Bob@example.com', 'password123')
+        out, errors = self.run_command('users.csv', '\n'.join([
+            'username,email,password',
+            'bob2,Bob@EXAMPLE.COM,password123',
+            'nina,nina@Example.org,password123',
+            'nina2,nina@EXAMPLE.org,password123',
+        ]))
+
+        self.assertEqual(errors, [
+            'line 2: Email already exists: Bob@example.com',
+            'line 4: Duplicate email in file: nina@example.org',
+        ])
+        self.assertEqual(User.objects.get(username='nina').email, 'nina@example.org')
+
+    def test_dry_run_writes_nothing(self):
+        out, errors = self.run_command('users.csv', 'username,email,password\nkim,kim@example.com,password123\n',
+                                       dry_run=True)
+
+        self.assertIn('Dry run: 1 user(s) would be created', out)
+        self.assertFalse(User.objects.filter(username='kim').exists())
+
+    def test_conflict_in_batch_only_rejects_that_row(self):
+        content = '\n'.join([
+            'username,email,password',
+            'lena,lena@example.com,password123',
+            'taken,other@example.com,password123',
+            'mo,mo@example.com,password123',
+        ])
+        # As if 'taken' registered between the duplicate check and the insert
+        with mock.patch('airquality.management.commands.provision_users._existing', return_value=set()):
+            out, errors = self.run_command('users.csv', content)
+
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(errors[0].startswith('line 3: Rejected by database'))
+        self.assertIn('Created 2 user(s)', out)
+        self.assertEqual(User.objects.filter(username__in=['lena', 'mo']).count(), 2)
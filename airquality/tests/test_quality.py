@@ -0,0 +1,141 @@
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from airquality.ingest import build_reading, ingest_readings
+from airquality.models import AirQualityReading
+from airquality.quality import QualityPipeline
+
+T0 = datetime(2024, 5, 1, 12, 0, tzinfo=dt_timezone.utc)
+INTERVAL = timedelta(minutes=15)
+
+
+def slot(n):
+    return T0 + INTERVAL * n
+
+
+def record(n, aqi=80, pm25=30.0, location='Delhi'):
+    return {'location': location, 'timestamp': slot(n).isoformat(),
+            'aqi_value': aqi, 'pm25': pm25 + n * 0.1, 'pm10': 50.0 + n * 0.3}
+
+
+def reading(n, **values):
+    return build_reading(record(n, **values))
+
+
+class QualityPipelineTests(TestCase):
+    def setUp(self):
+        self.pipeline = QualityPipeline()
+
+    def test_spike_is_flagged(self):
+        for n in range(10):
+            self.assertEqual(self.pipeline.process(reading(n, aqi=80 + n % 3))[-1].quality_flags, 0)
+
+        spike = self.pipeline.process(reading(10, aqi=400))[-1]
+        self.assertTrue(spike.quality_flags & AirQualityReading.QUALITY_SPIKE)
+
+    @override_settings(AIRQUALITY_QUALITY={'REJECT_SPIKES': True})
+    def test_spike_can_be_rejected(self):
+        for n in range(10):
+            self.pipeline.process(reading(n, aqi=80 + n % 3))
+
+        self.assertEqual(self.pipeline.process(reading(10, aqi=400)), [])
+        self.assertEqual(self.pipeline.rejected, 1)
+
+    def test_stuck_sensor_is_flagged(self):
+        flags = []
+        for n in range(7):
+            stuck = build_reading({'location': 'Delhi', 'timestamp': slot(n).isoformat(),
+                                   'aqi_value': 80, 'pm25': 30.0, 'pm10': 50.0 + n})
+            flags.append(self.pipeline.process(stuck)[-1].quality_flags)
+
+        self.assertEqual(flags[:5], [0] * 5)
+        self.assertTrue(all(flag & AirQualityReading.QUALITY_STUCK for flag in flags[5:]))
+
+    def test_out_of_range_is_rejected(self):
+        self.assertEqual(self.pipeline.process(reading(0, aqi=5000)), [])
+        self.assertEqual(self.pipeline.rejected, 1)
+
+    def test_short_gap_is_interpolated(self):
+        self.pipeline.process(reading(0, aqi=80))
+        accepted = self.pipeline.process(reading(3, aqi=110))
+
+        self.assertEqual([r.timestamp for r in accepted], [slot(1), slot(2), slot(3)])
+        self.assertEqual([r.aqi_value for r in accepted], [90, 100, 110])
+        self.assertEqual([r.quality_flags for r in accepted[:2]], [AirQualityReading.QUALITY_INTERPOLATED] * 2)
+
+    def test_long_gap_is_not_interpolated(self):
+        self.pipeline.process(reading(0))
+        self.assertEqual(len(self.pipeline.process(reading(6))), 1)
+
+    def test_late_reading_does_not_move_gap_anchor_back(self):
+        self.pipeline.process(reading(0))
+        self.pipeline.process(reading(5))
+        self.pipeline.process(reading(3))
+
+        self.assertEqual(len(self.pipeline.process(reading(6))), 1)
+
+
+class IngestTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch('airquality.ingest.pipeline', QualityPipeline())
+        self.pipeline = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def stored(self):
+        return list(AirQualityReading.objects.order_by('timestamp').values_list('timestamp', 'quality_flags'))
+
+    def test_late_reading_does_not_duplicate_slots(self):
+        ingest_readings([record(n) for n in (0, 1, 2, 5)])
+        ingest_readings([record(3)])
+        ingest_readings([record(6)])
+
+        interpolated = AirQualityReading.QUALITY_INTERPOLATED
+        self.assertEqual(self.stored(), [
+            (slot(0), 0), (slot(1), 0), (slot(2), 0),
+            (slot(3), 0), (slot(4), interpolated), (slot(5), 0), (slot(6), 0),
+        ])
+
+    def test_workers_with_stale_state_do_not_duplicate_fillers(self):
+        other_worker = QualityPipeline()
+        ingest_readings([record(0)])
+        with mock.patch('airquality.ingest.pipeline', other_worker):
+            ingest_readings([record(0)])
+
+        ingest_readings([record(3)])
+        with mock.patch('airquality.ingest.pipeline', other_worker):
+            summary = ingest_readings([record(4)])
+
+        self.assertEqual(summary['interpolated'], 0)
+        self.assertEqual([ts for ts, _ in self.stored()], [slot(n) for n in range(5)])
+
+    def test_resent_reading_replaces_stored_one(self):
+        ingest_readings([record(0, aqi=80)])
+        ingest_readings([record(0, aqi=85)])
+
+        self.assertEqual(list(AirQualityReading.objects.values_list('aqi_value', flat=True)), [85])
+
+    def test_invalid_records_are_reported_per_index(self):
+        summary = ingest_readings([
+            record(0),
+            {**record(1), 'aqi_value': float('inf')},
+            {**record(2), 'pm25': float('nan')},
+            {**record(3), 'location': 'x' * 101},
+            {**record(4), 'data_source': 'y' * 51},
+            {**record(5), 'location': ['Delhi']},
+            {**record(6), 'pm10': 'lots'},
+        ])
+
+        self.assertEqual(summary['stored'], 1)
+        self.assertEqual([error['index'] for error in summary['errors']], [1, 2, 3, 4, 5, 6])
+
+    @override_settings(AIRQUALITY_INGEST_TOKEN='secret')
+    def test_infinity_in_request_body_is_a_row_error(self):
+        body = '[%s, {"location": "Delhi", "aqi_value": Infinity, "pm25": 1, "pm10": 1}]' % json.dumps(record(0))
+        response = self.client.post('/api/readings/ingest/', body, content_type='application/json',
+                                    HTTP_X_INGEST_TOKEN='secret')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['errors'], [{'index': 1, 'error': 'pollutant values must be numeric'}])
@@ -0,0 +1,86 @@
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import msgpack
+import pandas as pd
+from django.test import RequestFactory, TestCase
+
+from airquality.models import AirQualityReading
+from airquality.renderers import (
+    COLUMNAR_JSON, COLUMNAR_MSGPACK, decode_timestamps, encode, to_columns, to_rows,
+)
+
+START = datetime(2024, 3, 1, tzinfo=dt_timezone.utc)
+
+
+def make_frame():
+    timestamps = [START, START + timedelta(minutes=15), START + timedelta(minutes=45),
+                  START + timedelta(hours=3)]
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime(timestamps, utc=True),
+        'aqi_value': [42, 57, 61, 70],
+        'pm25': [10.5, None, 14.25, 20.0],
+    })
+
+
+class WireFormatTests(TestCase):
+    fields = ['aqi_value', 'pm25']
+
+    def test_delta_timestamps_round_trip(self):
+        frame = make_frame()
+        columns = to_columns(frame, self.fields)
+
+        self.assertEqual(columns['timestamp']['deltas'], [0, 900, 1800, 8100])
+        decoded = decode_timestamps(columns['timestamp'])
+        self.assertEqual(decoded, [int(ts.timestamp()) for ts in frame['timestamp']])
+
+    def test_missing_values_become_none(self):
+        frame = make_frame()
+
+        self.assertEqual(to_columns(frame, self.fields)['columns']['pm25'], [10.5, None, 14.25, 20.0])
+        self.assertIsNone(to_rows(frame, self.fields)[1]['pm25'])
+        self.assertEqual(to_rows(frame, self.fields)[0]['timestamp'], START.isoformat())
+
+    def test_empty_frame(self):
+        frame = make_frame().iloc[:0]
+        columns = to_columns(frame, self.fields)
+
+        self.assertEqual(columns['count'], 0)
+        self.assertEqual(decode_timestamps(columns['timestamp']), [])
+
+    def test_msgpack_and_json_carry_the_same_payload(self):
+        frame = make_frame()
+        as_json = json.loads(encode(frame, self.fields, COLUMNAR_JSON, meta={'location': 'Delhi'}))
+        as_msgpack = msgpack.unpackb(encode(frame, self.fields, COLUMNAR_MSGPACK, meta={'location': 'Delhi'}))
+
+        self.assertEqual(as_json, as_msgpack)
+        self.assertEqual(as_json['fields'], ['timestamp', 'aqi_value', 'pm25'])
+
+
+class ReadingsEndpointTests(TestCase):
+    def setUp(self):
+        AirQualityReading.objects.bulk_create([
+            AirQualityReading(location='Delhi', timestamp=START + timedelta(minutes=15 * i),
+                              aqi_value=100 + i, pm25=30.0, pm10=45.0)
+            for i in range(5)
+        ])
+
+    def test_limit_is_clamped(self):
+        for limit, expected in (('-1', 1), ('0', 1), ('3', 3), ('5000', 5)):
+            response = self.client.get('/api/readings/', {'limit': limit})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['count'], expected)
+
+    def test_non_integer_limit(self):
+        response = self.client.get('/api/readings/', {'limit': 'ten'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_format_negotiation(self):
+        response = self.client.get('/api/readings/', HTTP_ACCEPT=COLUMNAR_MSGPACK)
+        self.assertEqual(response['Content-Type'], COLUMNAR_MSGPACK)
+        self.assertIn('Accept', response['Vary'])
+        payload = msgpack.unpackb(response.content)
+        self.assertEqual(payload['columns']['aqi_value'], [104, 103, 102, 101, 100])
+
+        response = self.client.get('/api/readings/', {'format': 'xml'})
+        self.assertEqual(response.status_code, 406)
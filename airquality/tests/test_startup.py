@@ -0,0 +1,35 @@
+import subprocess
+import sys
+import types
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from airquality.lazy import HEAVY_MODULES, LazyModule, lazy_import
+
+
+class LazyImportTests(SimpleTestCase):
+    def test_import_happens_on_first_attribute_access(self):
+        module = lazy_import('json')
+
+        self.assertIsInstance(module, LazyModule)
+        self.assertIsNone(module._module)
+        self.assertEqual(module.dumps([1]), '[1]')
+        self.assertIsInstance(module._module, types.ModuleType)
+
+    def test_optional_missing_package(self):
+        self.assertIsNone(lazy_import('airquality_no_such_package', optional=True))
+        self.assertIsInstance(lazy_import('airquality_no_such_package'), LazyModule)
+
+    def test_boot_does_not_import_heavy_modules(self):
+        script = (
+            'import sys\n'
+            'from pollution_project.wsgi import application\n'
+            'from django.urls import get_resolver\n'
+            'get_resolver().url_patterns\n'
+            'print(",".join(m for m in sys.argv[1:] if m in sys.modules))\n'
+        )
+        result = subprocess.run([sys.executable, '-c', script, *HEAVY_MODULES],
+                                cwd=settings.BASE_DIR, capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.strip(), '')
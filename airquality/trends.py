@@ -0,0 +1,154 @@
+"""
+Range and aggregate queries over air quality readings.
+
+Cold readings live in the Parquet archive (see airquality.archive) and hot
+readings in the database. Queries read only the partitions and columns they
+need, memory-mapping the files, and merge the result with matching DB rows
+so callers never need to know where a reading is stored.
+"""
+from datetime import datetime, time, timezone as dt_timezone
+
+from django.utils import timezone
+
+from .archive import archive_root, location_dir, partition_path
+from .lazy import lazy_import
+from .models import AirQualityReading
+
+pd = lazy_import('pandas')
+
+POLLUTANT_FIELDS = [
+    'aqi_value', 'pm25', 'pm10', 'no2', 'so2', 'co', 'o3',
+    'temperature', 'humidity', 'wind_speed', 'visibility',
+]
+
+# Supported bucket sizes mapped to pandas offset aliases
+INTERVALS = {
+    'hour': 'h',
+    'day': 'D',
+    'week': 'W-MON',
+    'month': 'MS',
+}
+
+AGGREGATES = ('mean', 'min', 'max')
+
+
+def _as_utc(value):
+    """Normalise a date/datetime to an aware UTC pandas Timestamp"""
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value, dt_timezone.utc)
+    return pd.Timestamp(value).tz_convert('UTC')
+
+
+def _partition_files(location, start, end, root):
+    """Archive files that can contain readings for the given location/range"""
+    if location and start is not None and end is not None:
+        months = pd.period_range(start.tz_localize(None), end.tz_localize(None), freq='M')
+        candidates = [partition_path(location, str(month), root) for month in months]
+        return [path for path in candidates if path.exists()]
+
+    pattern = f'{location_dir(location)}/*.parquet' if location else '*/*.parquet'
+    files = sorted(root.glob(pattern))
+    if start is not None:
+        files = [f for f in files if f.stem >= start.strftime('%Y-%m')]
+    if end is not None:
+        files = [f for f in files if f.stem <= end.strftime('%Y-%m')]
+    return files
+
+
+def read_archive(location=None, start=None, end=None, fields=None, root=None):
+    """
+    Readings from the Parquet archive as a DataFrame.
+
+    ``start`` is inclusive and ``end`` exclusive. Only ``fields`` (plus id,
+    location and timestamp) are read from disk.
+    """
+    start, end = _as_utc(start), _as_utc(end)
+    columns = ['id', 'location', 'timestamp'] + list(fields or POLLUTANT_FIELDS)
+    files = _partition_files(location, start, end, root or archive_root())
+    if not files:
+        return pd.DataFrame(columns=columns)
+
+    filters = []
+    if location:
+        filters.append(('location', '==', location))
+    if start is not None:
+        filters.append(('timestamp', '>=', start))
+    if end is not None:
+        filters.append(('timestamp', '<', end))
+
+    frames = [
+        pd.read_parquet(path, engine='pyarrow', columns=columns,
+                        filters=filters or None, memory_map=True)
+        for path in files
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def read_database(location=None, start=None, end=None, fields=None):
+    """Readings still held in the database as a DataFrame"""
+    columns = ['id', 'location', 'timestamp'] + list(fields or POLLUTANT_FIELDS)
+    queryset = AirQualityReading.objects.all()
+    if location:
+        queryset = queryset.filter(location=location)
+    if start is not None:
+        queryset = queryset.filter(timestamp__gte=start)
+    if end is not None:
+        queryset = queryset.filter(timestamp__lt=end)
+
+    frame = pd.DataFrame.from_records(queryset.order_by().values_list(*columns), columns=columns)
+    frame['timestamp'] = pd.to_datetime(frame['timestamp'], utc=True)
+    return frame
+
+
+def load_readings(location=None, start=None, end=None, fields=None, root=None):
+    """Archived and live readings merged into one time-ordered DataFrame"""
+    start, end = _as_utc(start), _as_utc(end)
+    cold = read_archive(location, start, end, fields, root)
+    hot = read_database(location, start, end, fields)
+    frames = [frame for frame in (cold, hot) if not frame.empty]
+    if not frames:
+        return hot
+
+    merged = pd.concat(frames, ignore_index=True)
+    # A reading can briefly exist in both places while an archive run is in flight
+    merged = merged.drop_duplicates(subset='id', keep='last')
+    return merged.sort_values('timestamp').reset_index(drop=True)
+
+
+def aggregate_readings(location=None, start=None, end=None, fields=None,
+                       interval='day', aggregates=AGGREGATES, root=None):
+    """
+    Bucket readings by ``interval`` and aggregate each field.
+
+    Returns a list of dicts such as
+    ``{'period': '2024-01-01T00:00:00+00:00', 'count': 24, 'pm25_mean': 81.2, ...}``.
+    """
+    if interval not in INTERVALS:
+        raise ValueError(f'Unsupported interval: {interval}')
+    fields = list(fields or POLLUTANT_FIELDS)
+    unknown = set(fields) - set(POLLUTANT_FIELDS)
+    if unknown:
+        raise ValueError(f'Unsupported fields: {", ".join(sorted(unknown))}')
+
+    frame = load_readings(location, start, end, fields, root)
+    if frame.empty:
+        return []
+
+    grouped = frame.set_index('timestamp')[fields].astype('float64').resample(INTERVALS[interval])
+    summary = grouped.agg(list(aggregates))
+    summary.columns = [f'{field}_{agg}' for field, agg in summary.columns]
+    summary['count'] = frame.set_index('timestamp')['id'].resample(INTERVALS[interval]).count()
+    summary = summary[summary['count'] > 0]
+
+    series = []
+    for period, row in summary.iterrows():
+        point = {'period': period.isoformat(), 'count': int(row['count'])}
+        for column, value in row.items():
+            if column != 'count':
+                point[column] = None if pd.isna(value) else round(float(value), 2)
+        series.append(point)
+    return series
@@ -20,4 +20,13 @@ urlpatterns = [
     path('api/auth/login/', views.api_login, name='api_login'),
     path('api/auth/logout/', views.api_logout, name='api_logout'),
     path('api/auth/check/', views.api_check_auth, name='api_check_auth'),
+    path('api/auth/profile/', views.api_profile, name='api_profile'),
+    path('api/dashboard/summary/', views.api_dashboard_summary, name='api_dashboard_summary'),
+    path('api/trends/', views.api_trends, name='api_trends'),
+    path('api/readings/', views.api_readings, name='api_readings'),
+    path('api/readings/history/', views.api_history, name='api_history'),
+    path('api/readings/export/', views.api_export, name='api_export'),
+    path('api/readings/ingest/', views.api_ingest, name='api_ingest'),
+    path('api/rankings/', views.api_rankings, name='api_rankings'),
+    path('api/heatmap/<int:z>/<int:x>/<int:y>.<str:fmt>', views.api_heatmap_tile, name='api_heatmap_tile'),
 ]
\ No newline at end of file
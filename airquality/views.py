@@ -6,8 +6,23 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils import timezone
+from django.utils.text import slugify
+from django.conf import settings
+from django.utils.crypto import constant_time_compare
+from datetime import timedelta
 import json
 
+from . import dashboard as dashboard_snapshots, heatmap, trends
+from .leaderboard import category_bounds, get_leaderboard
+from .ingest import ingest_readings
+from .lazy import lazy_import
+from .models import AirQualityReading, SavedLocation, UserProfile
+from .renderers import render_readings
+
+pd = lazy_import('pandas')
+
 # Create your views here.
 
 def index(request):
@@ -41,7 +56,8 @@ def data(request):
 def dashboard(request):
     """User dashboard view - requires login"""
     return render(request, 'airquality/dashboard.html', {
-        'title': 'Dashboard - AirAware'
+        'title': 'Dashboard - AirAware',
+        'snapshot': dashboard_snapshots.get_snapshot(request.user)
     })
 
 def user_login(request):
@@ -279,3 +295,285 @@ def api_check_auth(request):
     return JsonResponse({
         'authenticated': False
     }, status=200)
+
+def _parse_range(request, default_days):
+    """Read start/end query parameters; returns (start, end) or None if invalid"""
+    try:
+        end = _parse_when(request.GET.get('end')) or timezone.now()
+        start = _parse_when(request.GET.get('start')) or end - timedelta(days=default_days)
+    except ValueError:
+        return None
+    return start, end
+
+def _parse_when(value):
+    """Parse an ISO date or datetime query parameter"""
+    if not value:
+        return None
+    return parse_datetime(value) or parse_date(value)
+
+@require_http_methods(["GET"])
+def api_trends(request):
+    """API endpoint for pollutant trends over archived and live readings"""
+    location = request.GET.get('location', '').strip() or None
+    interval = request.GET.get('interval', 'day')
+    fields = [f.strip() for f in request.GET.get('fields', 'aqi_value,pm25,pm10').split(',') if f.strip()]
+
+    date_range = _parse_range(request, default_days=30)
+    if date_range is None:
+        return JsonResponse({
+            'error': 'Invalid start or end date'
+        }, status=400)
+    start, end = date_range
+
+    try:
+        series = trends.aggregate_readings(
+            location=location,
+            start=start,
+            end=end,
+            fields=fields,
+            interval=interval
+        )
+    except ValueError as e:
+        return JsonResponse({
+            'error': str(e)
+        }, status=400)
+
+    return JsonResponse({
+        'location': location,
+        'interval': interval,
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'series': series
+    }, status=200)
+
+@require_http_methods(["GET"])
+def api_readings(request):
+    """API endpoint for the most recent readings, optionally for one location"""
+    location = request.GET.get('location', '').strip()
+    try:
+        limit = max(1, min(int(request.GET.get('limit', 100)), 1000))
+    except ValueError:
+        return JsonResponse({
+            'error': 'limit must be an integer'
+        }, status=400)
+
+    fields = ['location'] + trends.POLLUTANT_FIELDS
+    queryset = AirQualityReading.objects.order_by('-timestamp')
+    if location:
+        queryset = queryset.filter(location=location)
+    rows = list(queryset.values('timestamp', *fields)[:limit])
+    frame = pd.DataFrame.from_records(rows, columns=['timestamp'] + fields)
+
+    return render_readings(request, frame, fields, meta={'location': location or None})
+
+@require_http_methods(["GET"])
+def api_history(request):
+    """API endpoint for a location's reading history over archived and live data"""
+    location = request.GET.get('location', '').strip()
+    if not location:
+        return JsonResponse({
+            'error': 'location is required'
+        }, status=400)
+
+    date_range = _parse_range(request, default_days=7)
+    if date_range is None:
+        return JsonResponse({
+            'error': 'Invalid start or end date'
+        }, status=400)
+    start, end = date_range
+
+    fields = trends.POLLUTANT_FIELDS
+    frame = trends.load_readings(location=location, start=start, end=end, fields=fields)
+    return render_readings(request, frame, fields, meta={
+        'location': location,
+        'start': start.isoformat(),
+        'end': end.isoformat()
+    })
+
+@login_required
+@require_http_methods(["GET"])
+def api_export(request):
+    """API endpoint to download readings for a date range - requires login"""
+    location = request.GET.get('location', '').strip() or None
+    date_range = _parse_range(request, default_days=30)
+    if date_range is None:
+        return JsonResponse({
+            'error': 'Invalid start or end date'
+        }, status=400)
+    start, end = date_range
+
+    fields = ['location'] + trends.POLLUTANT_FIELDS
+    frame = trends.load_readings(location=location, start=start, end=end,
+                                 fields=trends.POLLUTANT_FIELDS)
+    filename = f"airaware-{slugify(location or 'all')}-{start:%Y%m%d}-{end:%Y%m%d}"
+    return render_readings(request, frame, fields, meta={
+        'location': location,
+        'start': start.isoformat(),
+        'end': end.isoformat()
+    }, filename=filename)
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def api_ingest(request):
+    """API endpoint for sensors to push readings (single object or list)"""
+    token = getattr(settings, 'AIRQUALITY_INGEST_TOKEN', '')
+    if not token:
+        return JsonResponse({
+            'error': 'Ingest is not configured'
+        }, status=503)
+    if not constant_time_compare(request.headers.get('X-Ingest-Token', ''), token):
+        return JsonResponse({
+            'error': 'Invalid ingest token'
+        }, status=403)
+
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({
+            'error': 'Invalid JSON data'
+        }, status=400)
+
+    records = data if isinstance(data, list) else [data]
+    summary = ingest_readings(records)
+    status = 201 if summary['stored'] else 400
+    return JsonResponse(summary, status=status)
+
+@require_http_methods(["GET"])
+def api_heatmap_tile(request, z, x, y, fmt):
+    """API endpoint for interpolated pollution map tiles (PNG or JSON grid)"""
+    field = request.GET.get('field', 'aqi_value')
+    if field not in heatmap.FIELDS:
+        return JsonResponse({
+            'error': f'Unsupported field: {field}'
+        }, status=400)
+    if fmt not in heatmap.RENDERERS:
+        return JsonResponse({
+            'error': f'Unsupported tile format: {fmt}'
+        }, status=400)
+    if z > heatmap.MAX_ZOOM or not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        return JsonResponse({
+            'error': 'Tile out of range'
+        }, status=404)
+
+    # Answer revalidations from the version alone, without loading the tile
+    version = heatmap.data_version()
+    etag = f'"{version}"'
+    if request.headers.get('If-None-Match') == etag:
+        return HttpResponse(status=304)
+    version, tile = heatmap.tile_cache.get(field, z, x, y, fmt, version=version)
+
+    content_type = 'image/png' if fmt == 'png' else 'application/json'
+    response = HttpResponse(tile, content_type=content_type)
+    response['ETag'] = etag
+    response['Cache-Control'] = 'public, max-age=300'
+    return response
+
+@require_http_methods(["GET"])
+def api_dashboard_summary(request):
+    """API endpoint for the user's precomputed dashboard snapshot"""
+    if not request.user.is_authenticated:
+        return JsonResponse({
+            'error': 'Not authenticated'
+        }, status=401)
+    return JsonResponse(dashboard_snapshots.get_snapshot(request.user), status=200)
+
+@require_http_methods(["GET", "POST"])
+def api_profile(request):
+    """API endpoint to read or update location and health conditions"""
+    if not request.user.is_authenticated:
+        return JsonResponse({
+            'error': 'Not authenticated'
+        }, status=401)
+
+    profile = dashboard_snapshots.get_profile(request.user)
+
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+        except json.JSONDecodeError:
+            data = None
+        if not isinstance(data, dict):
+            return JsonResponse({
+                'error': 'Invalid JSON data'
+            }, status=400)
+
+        valid_conditions = {key for key, _ in UserProfile.HEALTH_CONDITIONS}
+        conditions = data.get('health_conditions', profile.health_conditions)
+        if not (isinstance(conditions, list) and all(isinstance(c, str) for c in conditions)
+                and set(conditions) <= valid_conditions):
+            return JsonResponse({
+                'health_conditions': [f'Choose from: {", ".join(sorted(valid_conditions))}']
+            }, status=400)
+
+        max_length = UserProfile._meta.get_field('location').max_length
+        location = data.get('location', profile.location)
+        if location is None:
+            location = ''
+        if not isinstance(location, str) or len(location.strip()) > max_length:
+            return JsonResponse({
+                'location': [f'Must be a location name of at most {max_length} characters']
+            }, status=400)
+
+        saved = data.get('saved_locations')
+        if saved is not None and not (isinstance(saved, list) and all(
+                isinstance(s, str) and len(s.strip()) <= max_length for s in saved)):
+            return JsonResponse({
+                'saved_locations': [f'Must be a list of location names of at most {max_length} characters']
+            }, status=400)
+
+        profile.location = location.strip()
+        profile.health_conditions = conditions
+        profile.save()
+
+        if saved is not None:
+            names = {name.strip() for name in saved if name.strip()}
+            request.user.saved_locations.exclude(location__in=names).delete()
+            existing = set(request.user.saved_locations.values_list('location', flat=True))
+            SavedLocation.objects.bulk_create([
+                SavedLocation(user=request.user, location=name) for name in sorted(names - existing)
+            ])
+
+        dashboard_snapshots.invalidate_user(request.user.id)
+
+    return JsonResponse({
+        'location': profile.location,
+        'saved_locations': list(request.user.saved_locations.values_list('location', flat=True)),
+        'health_conditions': profile.health_conditions
+    }, status=200)
+
+@require_http_methods(["GET"])
+def api_rankings(request):
+    """API endpoint ranking cities by current AQI, optionally within one category"""
+    order = request.GET.get('order', 'worst')
+    category = request.GET.get('category', '').strip()
+    if order not in ('worst', 'best'):
+        return JsonResponse({
+            'error': 'order must be "worst" or "best"'
+        }, status=400)
+    try:
+        limit = max(1, min(int(request.GET.get('limit', 10)), 500))
+    except ValueError:
+        return JsonResponse({
+            'error': 'limit must be an integer'
+        }, status=400)
+
+    board = get_leaderboard()
+    if category:
+        try:
+            lower, upper = category_bounds(category)
+        except ValueError as e:
+            return JsonResponse({
+                'error': str(e)
+            }, status=400)
+        rankings = board.in_range(lower, upper, limit)
+    else:
+        rankings = board.top(limit, worst=order == 'worst')
+
+    for rank, entry in enumerate(rankings, start=1):
+        entry['rank'] = rank
+
+    return JsonResponse({
+        'order': 'worst' if category else order,
+        'category': category or None,
+        'rankings': rankings
+    }, status=200)
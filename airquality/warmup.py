@@ -0,0 +1,65 @@
+"""
+Process warmup hooks, called from gunicorn.conf.py.
+
+``preload`` runs once in the gunicorn master (with ``preload_app``) before
+workers fork, so imports done there are shared copy-on-write by every
+worker. ``warm_worker`` runs in each worker before it accepts requests and
+opens the per-process resources that must not be shared across a fork: the
+database connection and the in-memory caches.
+"""
+import importlib
+import logging
+import time
+
+from django.core.cache import cache
+from django.db import connections
+
+from .lazy import HEAVY_MODULES
+
+logger = logging.getLogger(__name__)
+
+
+def preload(heavy=False):
+    """Import the URLconf (and optionally heavy libraries) in the master process"""
+    started = time.perf_counter()
+    from django.urls import get_resolver
+    get_resolver().url_patterns
+
+    if heavy:
+        for name in HEAVY_MODULES:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                logger.warning('Preload skipped missing module %s', name)
+
+    elapsed = (time.perf_counter() - started) * 1000
+    logger.info('Preloaded application%s in %.0f ms', ' and heavy modules' if heavy else '', elapsed)
+    return elapsed
+
+
+def warm_worker():
+    """Open a DB connection and fill per-process caches before the first request"""
+    started = time.perf_counter()
+
+    # Connections inherited from the master can't be used after fork
+    connections.close_all()
+    for conn in connections.all():
+        try:
+            conn.ensure_connection()
+        except Exception:
+            logger.exception('Warmup could not connect to database %s', conn.alias)
+
+    try:
+        cache.get('airquality:warmup')
+    except Exception:
+        logger.exception('Warmup could not reach the cache')
+
+    try:
+        from .leaderboard import get_leaderboard
+        get_leaderboard().top(1)
+    except Exception:
+        logger.exception('Warmup could not load the leaderboard')
+
+    elapsed = (time.perf_counter() - started) * 1000
+    logger.info('Worker warmed up in %.0f ms', elapsed)
+    return elapsed
@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for AirAware.
+
+Start with: gunicorn -c gunicorn.conf.py pollution_project.wsgi:application
+
+The app is loaded once in the master (preload_app) and forked into workers,
+which then open their own DB connection and warm their caches before taking
+traffic. Set GUNICORN_PRELOAD_HEAVY=True to also import pandas/SciPy/etc.
+in the master, trading a slower master boot for workers that never pay
+that import on a request.
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'True') == 'True'
+
+
+def when_ready(server):
+    if preload_app:
+        from airquality.warmup import preload
+        preload(heavy=os.environ.get('GUNICORN_PRELOAD_HEAVY', 'False') == 'True')
+
+
+def post_worker_init(worker):
+    # Runs in each worker once the app is loaded, before it accepts requests
+    from airquality.warmup import warm_worker
+    warm_worker()
@@ -41,13 +41,14 @@ if '.onrender.com' not in ALLOWED_HOSTS:
 # Application definition
 
 INSTALLED_APPS = [
+    # Listed before staticfiles so its collectstatic (inline asset extraction) wins
+    "airquality",
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
-    "airquality",
 ]
 
 MIDDLEWARE = [
@@ -102,6 +103,28 @@ else:
     }
 
 
+# Cache (dashboard snapshots). It must be shared by all gunicorn workers,
+# or an invalidation in one worker leaves stale snapshots in the others:
+# Redis when REDIS_URL is set (needed when running several instances),
+# otherwise files on local disk, shared by the workers of one instance.
+if 'REDIS_URL' in os.environ:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('CACHE_DIR', BASE_DIR / 'cache'),
+            'OPTIONS': {
+                'MAX_ENTRIES': 10000,
+            },
+        }
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -139,8 +162,19 @@ USE_TZ = True
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
-# Whitenoise for serving static files in production
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# Whitenoise for serving static files in production.
+# Manifest storage fingerprints every file and writes .gz (and .br when the
+# Brotli package is installed) copies at collectstatic time; WhiteNoise then
+# serves hashed names with "Cache-Control: max-age=..., public, immutable".
+# Django 5.1+ only reads STORAGES, STATICFILES_STORAGE is no longer honoured.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -151,3 +185,24 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 LOGIN_URL = 'airquality:login'
 LOGIN_REDIRECT_URL = 'airquality:dashboard'
 LOGOUT_REDIRECT_URL = 'airquality:index'
+
+# Cold storage for old readings (manage.py archive_readings)
+AIRQUALITY_ARCHIVE_ROOT = Path(os.environ.get('AIRQUALITY_ARCHIVE_ROOT', BASE_DIR / 'archive'))
+AIRQUALITY_ARCHIVE_AFTER_DAYS = int(os.environ.get('AIRQUALITY_ARCHIVE_AFTER_DAYS', 365))
+
+# Sensor ingest (api/readings/ingest/); sensors send this in X-Ingest-Token
+AIRQUALITY_INGEST_TOKEN = os.environ.get('AIRQUALITY_INGEST_TOKEN', '')
+
+# Streaming quality checks, see airquality.quality.DEFAULTS for all keys
+AIRQUALITY_QUALITY = {
+    'INTERVAL_SECONDS': int(os.environ.get('AIRQUALITY_SENSOR_INTERVAL', 900)),
+    'REJECT_SPIKES': os.environ.get('AIRQUALITY_REJECT_SPIKES', 'False') == 'True',
+}
+
+# Rendered heatmap tiles (api/heatmap/), see airquality.heatmap.DEFAULTS for tuning
+AIRQUALITY_TILE_CACHE_DIR = Path(os.environ.get('AIRQUALITY_TILE_CACHE_DIR', BASE_DIR / 'tilecache'))
+
+# City rankings (api/rankings/): Redis sorted set when available, else in-process
+AIRQUALITY_LEADERBOARD_REDIS_URL = os.environ.get('REDIS_URL', '')
+# Cities without a reading this recent drop out of the rankings
+AIRQUALITY_LEADERBOARD_MAX_AGE_HOURS = int(os.environ.get('AIRQUALITY_LEADERBOARD_MAX_AGE_HOURS', 6))
@@ -28,13 +28,14 @@ if not DEBUG:
 
 # Application definition
 INSTALLED_APPS = [
+    # Listed before staticfiles so its collectstatic (inline asset extraction) wins
+    "airquality",
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
-    "airquality",
     "rest_framework",
     "corsheaders",
 ]
@@ -87,6 +88,28 @@ else:
         }
     }
 
+# Cache (dashboard snapshots). It must be shared by all gunicorn workers,
+# or an invalidation in one worker leaves stale snapshots in the others:
+# Redis when REDIS_URL is set (needed when running several instances),
+# otherwise files on local disk, shared by the workers of one instance.
+if 'REDIS_URL' in os.environ:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('CACHE_DIR', BASE_DIR / 'cache'),
+            'OPTIONS': {
+                'MAX_ENTRIES': 10000,
+            },
+        }
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -114,8 +137,16 @@ STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 STATICFILES_DIRS = []
 
-# Whitenoise configuration for serving static files
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# Whitenoise configuration for serving static files (hashed, precompressed
+# .gz/.br copies, immutable cache headers on fingerprinted names)
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -125,6 +156,27 @@ LOGIN_URL = 'airquality:login'
 LOGIN_REDIRECT_URL = 'airquality:dashboard'
 LOGOUT_REDIRECT_URL = 'airquality:index'
 
+# Cold storage for old readings (manage.py archive_readings)
+AIRQUALITY_ARCHIVE_ROOT = Path(os.environ.get('AIRQUALITY_ARCHIVE_ROOT', BASE_DIR / 'archive'))
+AIRQUALITY_ARCHIVE_AFTER_DAYS = int(os.environ.get('AIRQUALITY_ARCHIVE_AFTER_DAYS', 365))
+
+# Sensor ingest (api/readings/ingest/); sensors send this in X-Ingest-Token
+AIRQUALITY_INGEST_TOKEN = os.environ.get('AIRQUALITY_INGEST_TOKEN', '')
+
+# Streaming quality checks, see airquality.quality.DEFAULTS for all keys
+AIRQUALITY_QUALITY = {
+    'INTERVAL_SECONDS': int(os.environ.get('AIRQUALITY_SENSOR_INTERVAL', 900)),
+    'REJECT_SPIKES': os.environ.get('AIRQUALITY_REJECT_SPIKES', 'False') == 'True',
+}
+
+# Rendered heatmap tiles (api/heatmap/), see airquality.heatmap.DEFAULTS for tuning
+AIRQUALITY_TILE_CACHE_DIR = Path(os.environ.get('AIRQUALITY_TILE_CACHE_DIR', BASE_DIR / 'tilecache'))
+
+# City rankings (api/rankings/): Redis sorted set when available, else in-process
+AIRQUALITY_LEADERBOARD_REDIS_URL = os.environ.get('REDIS_URL', '')
+# Cities without a reading this recent drop out of the rankings
+AIRQUALITY_LEADERBOARD_MAX_AGE_HOURS = int(os.environ.get('AIRQUALITY_LEADERBOARD_MAX_AGE_HOURS', 6))
+
 # CORS Settings (allow frontend to access API)
 CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOWED_ORIGINS = os.environ.get('CORS_ALLOWED_ORIGINS', 'http://localhost:3000').split(',')